@@ -0,0 +1,109 @@
+"""Headless startup benchmark for GateBound.
+
+Launches main.py several times with the dummy SDL drivers, collects the
+phase timings main.py writes (GATEBOUND_STARTUP_REPORT) and prints a
+per-phase summary. Results are saved as JSON so runs can be compared.
+
+    python bench_startup.py                 # 5 warm runs
+    python bench_startup.py --cold -n 3     # clear .cache before every run
+    python bench_startup.py --out before.json
+"""
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+CACHE_DIR = os.path.join(ROOT, ".cache")
+
+
+def run_once(cold, timeout):
+    if cold:
+        shutil.rmtree(CACHE_DIR, ignore_errors=True)
+
+    fd, report_path = tempfile.mkstemp(suffix=".json", prefix="gatebound_startup_")
+    os.close(fd)
+
+    env = dict(os.environ)
+    env["SDL_VIDEODRIVER"] = "dummy"
+    env["SDL_AUDIODRIVER"] = "dummy"
+    env["PYGAME_HIDE_SUPPORT_PROMPT"] = "1"
+    env["GATEBOUND_STARTUP_REPORT"] = report_path
+
+    try:
+        t0 = time.perf_counter()
+        proc = subprocess.run(
+            [sys.executable, "main.py"],
+            cwd=ROOT,
+            env=env,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            timeout=timeout,
+        )
+        wall_ms = (time.perf_counter() - t0) * 1000
+
+        if proc.returncode != 0:
+            raise RuntimeError(
+                f"main.py exited with {proc.returncode}:\n{proc.stderr.decode(errors='replace')}"
+            )
+        with open(report_path, encoding="utf-8") as f:
+            report = json.load(f)
+    finally:
+        os.remove(report_path)
+
+    report["process_wall_ms"] = round(wall_ms, 3)
+    return report
+
+
+def summarize(runs):
+    """phase → {median, min, max} over all runs, in first-seen order."""
+    samples = {}
+    for run in runs:
+        for p in run["phases"]:
+            samples.setdefault(p["phase"], []).append(p["ms"])
+        samples.setdefault("first_menu_frame (total)", []).append(run["first_menu_frame_ms"])
+        samples.setdefault("process_wall", []).append(run["process_wall_ms"])
+
+    return {
+        name: {
+            "median_ms": round(statistics.median(values), 3),
+            "min_ms": round(min(values), 3),
+            "max_ms": round(max(values), 3),
+        }
+        for name, values in samples.items()
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-n", "--runs", type=int, default=5)
+    parser.add_argument("--cold", action="store_true", help="delete .cache before each run")
+    parser.add_argument("--out", default="startup_bench.json", help="JSON results file")
+    parser.add_argument("--timeout", type=float, default=120)
+    args = parser.parse_args()
+
+    runs = []
+    for i in range(args.runs):
+        runs.append(run_once(args.cold, args.timeout))
+        print(f"run {i + 1}/{args.runs}: first menu frame "
+              f"{runs[-1]['first_menu_frame_ms']:.1f} ms", file=sys.stderr)
+
+    summary = summarize(runs)
+
+    width = max(len(name) for name in summary)
+    print(f"{'phase':<{width}}  {'median':>9}  {'min':>9}  {'max':>9}")
+    for name, s in summary.items():
+        print(f"{name:<{width}}  {s['median_ms']:>9.1f}  {s['min_ms']:>9.1f}  {s['max_ms']:>9.1f}")
+
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump({"cold": args.cold, "summary": summary, "runs": runs}, f, indent=2)
+    print(f"\nwrote {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,366 @@
+"""GateBound rules engine.
+
+Everything that decides what happens in a run (the room grid, cards,
+gate trades, the store, points) lives here, without pygame, so it can
+be stepped headlessly for simulations and tests. main.py is a client on
+top of a GameState: it turns input into actions and draws game.*.
+
+Actions passed to GameState.step():
+    ("open_gate", direction, card_indices, reward_index)
+    ("trade", card_indices, target_type)
+    ("walk", direction)      # through a gate that is already open
+    ("tick", seconds)        # points decay
+
+Randomness comes from a run seed split into independent streams
+("rooms" for start/finish, "hand"), so a seed always gives the same run
+no matter which gates the player happens to look at first. Room types
+and gate cards are hashed from the seed and their coordinates instead,
+so the world is built lazily: only rooms that are touched are stored,
+and a 1000 x 1000 world costs no more to start than a 10 x 10 one.
+"""
+import hashlib
+import random
+
+GRID_W = 10
+GRID_H = 10
+
+ROOM_TYPES = ["Jungle", "Desert", "Ice", "Volcanic", "Arcane"]
+CARD_TYPES = ["Jungle", "Desert", "Ice", "Volcanic", "Arcane"]
+CARD_MIN_POWER = 1
+CARD_MAX_POWER = 9
+MAX_CARDS = 10
+START_CARD_MIN_POWER = 6   # starting hand is stronger than gate rewards
+GATE_REWARDS = 2
+MIN_FINISH_DISTANCE = 6    # Manhattan distance start → finish
+
+DIFFICULTY_EASY = "easy"
+DIFFICULTY_MEDIUM = "medium"
+DIFFICULTY_HARD = "hard"
+
+# minimap_radius / score_multiplier are only used by the client
+difficulty_settings = {
+    DIFFICULTY_EASY: {
+        "max_points": 1000,
+        "point_decay": 1,
+        "minimap_radius": 5,
+        "store_uses": 3,
+        "score_multiplier": 1
+    },
+    DIFFICULTY_MEDIUM: {
+        "max_points": 500,
+        "point_decay": 1,
+        "minimap_radius": 3,
+        "store_uses": 2,
+        "score_multiplier": 3
+    },
+    DIFFICULTY_HARD: {
+        "max_points": 300,
+        "point_decay": 1,
+        "minimap_radius": 2,
+        "store_uses": 1,
+        "score_multiplier": 5
+    }
+}
+
+OPPOSITE = {"top": "bottom", "bottom": "top", "left": "right", "right": "left"}
+
+
+def new_seed():
+    return random.randrange(2 ** 32)
+
+
+def seed_hash(*key):
+    """Stable 64-bit integer for a key (same key → same value on every run/platform)."""
+    digest = hashlib.blake2b(repr(key).encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+class Rooms(dict):
+    """room_id → room dict, built the first time a room is looked up."""
+
+    def __init__(self, game):
+        super().__init__()
+        self.game = game
+
+    def __missing__(self, rid):
+        game = self.game
+        if not 0 <= rid < game.grid_w * game.grid_h:
+            raise KeyError(rid)
+        x, y = game.pos(rid)
+
+        links = {}
+        if y > 0: links["top"] = game.room_id(x, y - 1)
+        if y < game.grid_h - 1: links["bottom"] = game.room_id(x, y + 1)
+        if x > 0: links["left"] = game.room_id(x - 1, y)
+        if x < game.grid_w - 1: links["right"] = game.room_id(x + 1, y)
+
+        room = self[rid] = {
+            "id": rid,
+            "pos": (x, y),
+            "type": ROOM_TYPES[seed_hash(game.seed, "room", x, y) % len(ROOM_TYPES)],
+            "links": links,
+            "open_gates": {d: False for d in links}
+        }
+        return room
+
+
+class GameState:
+    def __init__(self, seed=None, grid_w=GRID_W, grid_h=GRID_H):
+        self.seed = new_seed() if seed is None else seed
+        self.run = 0   # bumped by reset(); keeps gate cards apart between runs
+        self.rooms_rng = self.stream("rooms")
+        self.hand_rng = self.stream("hand")
+
+        self.grid_w = grid_w
+        self.grid_h = grid_h
+
+        self.max_points = 1000
+        self.point_decay = 1
+        self.store_max_uses = 3
+        self.store_uses_left = self.store_max_uses
+
+        self.points = self.max_points
+        self.time_accumulator = 0
+        self.game_over = False
+        self.game_win = False
+        self.ended = False
+        self.message = ""
+
+        # gate_cards[room_id][direction] = {"power": X, "rewards": [...]}
+        self.gate_cards = {}
+        self.visited_rooms = set()
+        self.explored_rooms = set()
+        self.opened_gates = []   # (room_id, direction) in the order they were opened
+
+        self.cards = self.deal_cards()
+        self.rooms = Rooms(self)
+
+        self.finish_room = self.random_room_id()
+        self.place_start()
+
+    def stream(self, *name):
+        """Independent RNG for one part of the run, derived from the seed."""
+        return random.Random(":".join(str(p) for p in (self.seed,) + name))
+
+    # ---------- setup ----------
+    def configure(self, max_points, point_decay, store_uses):
+        """Apply difficulty settings."""
+        self.max_points = max_points
+        self.point_decay = point_decay
+        self.store_max_uses = store_uses
+        self.store_uses_left = store_uses
+
+    def reset(self):
+        """New run on the same world: fresh hand, gates and start room."""
+        self.points = self.max_points
+        self.game_over = False
+        self.game_win = False
+        self.ended = False
+        self.message = ""
+
+        self.visited_rooms.clear()
+        self.explored_rooms.clear()
+        self.gate_cards.clear()
+        self.opened_gates.clear()
+        self.run += 1
+
+        self.cards[:] = self.deal_cards()
+        self.place_start()
+
+    def place_start(self):
+        """Random start room at least MIN_FINISH_DISTANCE from the finish."""
+        # small worlds may have no room that far away: go as far as they allow
+        x, y = self.pos(self.finish_room)
+        farthest = max(x, self.grid_w - 1 - x) + max(y, self.grid_h - 1 - y)
+        min_distance = min(MIN_FINISH_DISTANCE, farthest)
+
+        self.current = self.random_room_id()
+        while self.distance(self.current, self.finish_room) < min_distance:
+            self.current = self.random_room_id()
+        self.start_room = self.current
+        self.visited_rooms.add(self.current)
+        self.explored_rooms.add(self.current)
+
+    def room_id(self, x, y):
+        return y * self.grid_w + x
+
+    def pos(self, rid):
+        return rid % self.grid_w, rid // self.grid_w
+
+    def random_room_id(self):
+        x = self.rooms_rng.randint(0, self.grid_w - 1)
+        y = self.rooms_rng.randint(0, self.grid_h - 1)
+        return self.room_id(x, y)
+
+    def distance(self, a, b):
+        ax, ay = self.pos(a)
+        bx, by = self.pos(b)
+        return abs(ax - bx) + abs(ay - by)
+
+    def random_card(self, rng):
+        return {
+            "type": rng.choice(CARD_TYPES),
+            "power": rng.randint(CARD_MIN_POWER, CARD_MAX_POWER)
+        }
+
+    def deal_cards(self):
+        rng = self.hand_rng
+        hand = []
+        for _ in range(MAX_CARDS):
+            c = self.random_card(rng)
+            c["power"] = rng.randint(START_CARD_MIN_POWER, CARD_MAX_POWER)
+            hand.append(c)
+        return hand
+
+    # ---------- queries ----------
+    def gate_card(self, room_id, direction):
+        """Gate requirement + rewards, created the first time it is looked at."""
+        gates = self.gate_cards.setdefault(room_id, {})
+        if direction not in gates:
+            h = seed_hash(self.seed, self.run, "gate", room_id, direction)
+            h, power = divmod(h, CARD_MAX_POWER - CARD_MIN_POWER + 1)
+            power += CARD_MIN_POWER
+            rewards = []
+            for _ in range(GATE_REWARDS):
+                h, t = divmod(h, len(CARD_TYPES))
+                rewards.append({"type": CARD_TYPES[t], "power": power})
+            gates[direction] = {"power": power, "rewards": rewards}
+        return gates[direction]
+
+    def next_room_type(self, direction):
+        nxt = self.rooms[self.current]["links"].get(direction)
+        if nxt is None:
+            return None
+        return self.rooms[nxt]["type"]
+
+    def gate_open(self, direction):
+        return self.rooms[self.current]["open_gates"].get(direction, False)
+
+    def can_use_card(self, card, direction):
+        """True if card is the gate's type and the hand can reach its power."""
+        if direction is None:
+            return False
+
+        required_type = self.next_room_type(direction)
+        required_power = self.gate_card(self.current, direction)["power"]
+
+        if card["type"] != required_type:
+            return False
+
+        total = sum(c["power"] for c in self.cards if c["type"] == required_type)
+        return total >= required_power
+
+    # ---------- actions ----------
+    def step(self, action):
+        """Apply one action → True if it succeeded (see self.message)."""
+        kind = action[0]
+        if kind == "tick":
+            return self.tick(action[1])
+        if kind == "walk":
+            return self.walk(action[1])
+        if kind == "open_gate":
+            return self.open_gate(action[1], action[2], action[3])
+        if kind == "trade":
+            return self.trade(action[1], action[2])
+        raise ValueError(f"unknown action {kind!r}")
+
+    def fail(self, message):
+        self.message = message
+        return False
+
+    def open_gate(self, direction, card_indices, reward_index):
+        required_type = self.next_room_type(direction)
+        gate = self.gate_card(self.current, direction)
+
+        chosen = [self.cards[i] for i in card_indices]
+
+        if any(c["type"] != required_type for c in chosen):
+            return self.fail("WRONG CARD TYPE!")
+
+        if sum(c["power"] for c in chosen) < gate["power"]:
+            return self.fail("NOT ENOUGH POWER!")
+
+        if reward_index is None:
+            return self.fail("CHOOSE A REWARD!")
+
+        for i in sorted(card_indices, reverse=True):
+            self.cards.pop(i)
+        self.cards.append(dict(gate["rewards"][reward_index]))
+
+        # open gate both sides
+        nxt = self.rooms[self.current]["links"][direction]
+        self.rooms[self.current]["open_gates"][direction] = True
+        self.rooms[nxt]["open_gates"][OPPOSITE[direction]] = True
+        self.opened_gates.append((self.current, direction))
+
+        self.enter(direction)
+        self.message = "GATE OPENED!"
+        return True
+
+    def enter(self, direction):
+        """Move through a gate just opened: explores around and checks the goal."""
+        room = self.rooms[self.current]
+        for nxt in room["links"].values():
+            self.explored_rooms.add(nxt)
+
+        if direction in room["links"]:
+            self.current = room["links"][direction]
+            self.visited_rooms.add(self.current)
+            self.explored_rooms.add(self.current)
+            self.check_finish()
+
+    def walk(self, direction):
+        """Go back through a gate that is already open."""
+        if not self.gate_open(direction):
+            return self.fail("GATE CLOSED!")
+
+        self.current = self.rooms[self.current]["links"].get(direction, self.current)
+        self.rooms[self.current]["open_gates"][OPPOSITE[direction]] = True
+        return True
+
+    def trade(self, card_indices, target_type):
+        if self.store_uses_left <= 0:
+            return self.fail("STORE EMPTY!")
+
+        if len(card_indices) != 2:
+            return self.fail("SELECT 2 CARDS!")
+
+        i1, i2 = list(card_indices)
+        c1 = self.cards[i1]
+        c2 = self.cards[i2]
+
+        if c1["type"] != c2["type"]:
+            return self.fail("CARDS MUST BE SAME TYPE!")
+
+        if target_type is None:
+            return self.fail("CHOOSE TARGET TYPE!")
+
+        new_power = min(c1["power"] + c2["power"], CARD_MAX_POWER)
+
+        for i in sorted(card_indices, reverse=True):
+            self.cards.pop(i)
+        self.cards.append({"type": target_type, "power": new_power})
+
+        self.store_uses_left -= 1
+        self.message = f"TRADE SUCCESS! POWER {new_power}"
+        return True
+
+    def tick(self, seconds):
+        """Advance the clock; points drop by point_decay once per full second."""
+        self.time_accumulator += seconds
+
+        if not self.game_over and not self.game_win:
+            if self.time_accumulator >= 1:
+                self.points -= self.point_decay
+                self.time_accumulator = 0
+
+                if self.points <= 0:
+                    self.points = 0
+                    self.game_over = True
+                    self.ended = True
+        return True
+
+    def check_finish(self):
+        if self.current == self.finish_room:
+            self.game_win = True
+            self.ended = True
@@ -0,0 +1,317 @@
+"""Cheapest-route hints from the current room to the finish.
+
+A gate costs its power and can only be used if the hand holds enough
+power of the next room's type; an open gate costs nothing. Internally
+every step also costs 1 (power is scaled by POWER_SCALE), which breaks
+ties towards shorter routes and keeps all edge costs positive, as D*
+Lite needs. The route is kept up to date with D* Lite: the search runs
+backwards from the finish, so when the player moves, a gate opens or the
+hand changes only the affected rooms are repaired instead of searching
+again from scratch. Work is capped per call and resumes on the next one,
+so it stays interactive on very large grids.
+
+    hints = RouteHints(game)
+    path = hints.update()   # [current, ..., finish_room], or None while searching / blocked
+    hints.done              # False → still searching, keep showing the old route
+    hints.cost()            # power the route costs
+
+    python hints.py [seeds]  # check routes against a full Dijkstra, across resets
+"""
+import heapq
+
+from engine import OPPOSITE
+
+INF = float("inf")
+POWER_SCALE = 10 ** 6   # one power point outweighs any number of steps
+EXPANSIONS_PER_UPDATE = 200   # ≈ 10 ms of search per frame on a fresh area
+
+
+class RouteHints:
+    def __init__(self, game):
+        self.game = game
+        self.run = None    # rebuilt whenever the game starts a new run
+        self.done = False  # last update() finished searching (None then means no route)
+
+    # ---------- graph ----------
+    def hand_power(self):
+        """Total hand power per card type (what a single gate can be paid with)."""
+        power = {}
+        for c in self.game.cards:
+            power[c["type"]] = power.get(c["type"], 0) + c["power"]
+        return power
+
+    def gate(self, u, d):
+        """(type, power) needed to open u's gate towards d; evaluated gates are indexed by type."""
+        key = (u, d)
+        if key not in self.gates:
+            game = self.game
+            v = game.rooms[u]["links"][d]
+            self.gates[key] = (game.rooms[v]["type"], game.gate_card(u, d)["power"])
+            self.by_type.setdefault(self.gates[key][0], []).append(key)
+        return self.gates[key]
+
+    def edge_cost(self, u, d):
+        if self.game.rooms[u]["open_gates"][d]:
+            return 1
+        room_type, power = self.gate(u, d)
+        return power * POWER_SCALE + 1 if self.power.get(room_type, 0) >= power else INF
+
+    def h(self, s):
+        """Lower bound on the cost from the current room to s.
+
+        Inside the open area around the current room a route gains at most
+        `reach` steps for free; every other open gate in the world (earlier
+        runs leave theirs open) adds at most one more. All steps beyond
+        those `free` ones pay power.
+        """
+        x, y = self.game.pos(s)
+        steps = abs(x - self.start_pos[0]) + abs(y - self.start_pos[1])
+        return steps + max(0, steps - self.free) * POWER_SCALE
+
+    # ---------- D* Lite ----------
+    def reset(self):
+        game = self.game
+        self.run = game.run
+        self.goal = game.finish_room
+        self.g = {}
+        self.rhs = {self.goal: 0}
+        self.queue = []
+        self.queued = {}   # room → key it was last queued with (stale heap entries are skipped)
+        self.km = 0
+        self.gates = {}
+        self.by_type = {}
+        self.power = self.hand_power()
+        self.open_edges = {
+            (rid, v) if rid < v else (v, rid)
+            for rid, room in game.rooms.items()
+            for d, v in room["links"].items() if room["open_gates"][d]
+        }
+        self.opened_seen = len(game.opened_gates)
+        self.start = game.current
+        self.start_pos, self.free = self.locate()
+        self.push(self.goal)
+
+    def locate(self):
+        """(current position, free steps) for h()."""
+        game = self.game
+        x, y = game.pos(game.current)
+        reach, inner = 0, 0
+        area, todo = {game.current}, [game.current]
+        while todo:
+            rid = todo.pop()
+            rx, ry = game.pos(rid)
+            reach = max(reach, abs(rx - x) + abs(ry - y))
+            room = game.rooms[rid]
+            for d, v in room["links"].items():
+                if room["open_gates"][d]:
+                    inner += 1
+                    if v not in area:
+                        area.add(v)
+                        todo.append(v)
+        # each open gate in the area was counted from both sides
+        return (x, y), reach + len(self.open_edges) - inner // 2
+
+    def key(self, s):
+        m = min(self.g.get(s, INF), self.rhs.get(s, INF))
+        return (m + self.h(s) + self.km, m)
+
+    def push(self, s):
+        k = self.key(s)
+        self.queued[s] = k
+        heapq.heappush(self.queue, (k, s))
+
+    def top(self):
+        while self.queue:
+            k, s = self.queue[0]
+            if self.queued.get(s) == k:
+                return k, s
+            heapq.heappop(self.queue)
+        return (INF, INF), None
+
+    def update_vertex(self, u):
+        if u != self.goal:
+            links = self.game.rooms[u]["links"]
+            self.rhs[u] = min(
+                (self.edge_cost(u, d) + self.g.get(v, INF) for d, v in links.items()),
+                default=INF
+            )
+        self.requeue(u)
+
+    def requeue(self, u):
+        self.queued.pop(u, None)
+        if self.g.get(u, INF) != self.rhs.get(u, INF):
+            self.push(u)
+
+    def update_predecessors(self, s):
+        for d, u in self.game.rooms[s]["links"].items():
+            self.update_vertex(u)
+
+    def compute(self, budget):
+        """Repair g-values until the start is consistent → False if out of budget."""
+        start = self.start
+        for expanded in range(budget + 1):
+            k_old, u = self.top()
+            if u is None or (k_old >= self.key(start)
+                             and self.rhs.get(start, INF) == self.g.get(start, INF)):
+                return True
+            if expanded == budget:
+                break
+            heapq.heappop(self.queue)
+            del self.queued[u]
+
+            k_new = self.key(u)
+            if k_old < k_new:
+                self.push(u)
+            elif self.g.get(u, INF) > self.rhs.get(u, INF):
+                # g only dropped: a neighbour's rhs can only improve through u
+                g = self.g[u] = self.rhs[u]
+                for d, s in self.game.rooms[u]["links"].items():
+                    if s == self.goal:
+                        continue
+                    via_u = self.edge_cost(s, OPPOSITE[d]) + g
+                    if via_u < self.rhs.get(s, INF):
+                        self.rhs[s] = via_u
+                        self.requeue(s)
+            else:
+                self.g[u] = INF
+                self.update_vertex(u)
+                self.update_predecessors(u)
+        return False
+
+    # ---------- sync with the game ----------
+    def sync(self):
+        game = self.game
+        if self.run != game.run or self.goal != game.finish_room:
+            self.reset()
+            return
+
+        opened = game.opened_gates[self.opened_seen:]
+        self.opened_seen = len(game.opened_gates)
+        for u, d in opened:
+            v = game.rooms[u]["links"][d]
+            self.open_edges.add((u, v) if u < v else (v, u))
+
+        if game.current != self.start or opened:
+            old_pos, old_free = self.start_pos, self.free
+            self.start = game.current
+            self.start_pos, self.free = self.locate()
+            moved = abs(old_pos[0] - self.start_pos[0]) + abs(old_pos[1] - self.start_pos[1])
+            # keeps old queue keys lower bounds under the new heuristic
+            self.km += moved + max(0, moved + self.free - old_free) * POWER_SCALE
+
+        # newly opened gates are free both ways
+        for u, d in opened:
+            self.update_vertex(u)
+            self.update_vertex(game.rooms[u]["links"][d])
+
+        # hand changed: only gates whose affordability flipped need repair
+        old_power, self.power = self.power, self.hand_power()
+        for room_type in set(old_power) | set(self.power):
+            old, new = old_power.get(room_type, 0), self.power.get(room_type, 0)
+            lo, hi = min(old, new), max(old, new)
+            for u, d in self.by_type.get(room_type, ()) if old != new else ():
+                if lo < self.gates[(u, d)][1] <= hi:
+                    self.update_vertex(u)
+
+    def update(self, budget=EXPANSIONS_PER_UPDATE):
+        """Sync with the game, do up to `budget` expansions → route or None."""
+        self.sync()
+        self.done = self.compute(budget)
+        return self.path() if self.done else None
+
+    def path(self):
+        g = self.g
+        s = self.start
+        if g.get(s, INF) == INF:
+            return None
+
+        # only ever step to a strictly lower g, so the walk can't loop
+        route = [s]
+        rooms = self.game.rooms
+        while s != self.goal:
+            steps = [
+                (self.edge_cost(s, d) + g.get(v, INF), v)
+                for d, v in rooms[s]["links"].items() if g.get(v, INF) < g[s]
+            ]
+            if not steps or len(route) > len(g):
+                return None
+            s = min(steps)[1]
+            route.append(s)
+        return route
+
+    def cost(self):
+        """Power the current route costs (None if there is none yet)."""
+        g = self.g.get(self.start, INF)
+        return None if g == INF else g // POWER_SCALE
+
+
+# =========================
+# SELF-CHECK
+# =========================
+def dijkstra_cost(game):
+    """Power of the cheapest route from scratch (INF if blocked)."""
+    power = {}
+    for c in game.cards:
+        power[c["type"]] = power.get(c["type"], 0) + c["power"]
+    dist = {game.current: 0}
+    todo = [(0, game.current)]
+    while todo:
+        cost, u = heapq.heappop(todo)
+        if cost > dist[u]:
+            continue
+        room = game.rooms[u]
+        for d, v in room["links"].items():
+            if room["open_gates"][d]:
+                step = 0
+            else:
+                step = game.gate_card(u, d)["power"]
+                if power.get(game.rooms[v]["type"], 0) < step:
+                    continue
+            if cost + step < dist.get(v, INF):
+                dist[v] = cost + step
+                heapq.heappush(todo, (cost + step, v))
+    return dist.get(game.finish_room, INF)
+
+
+def check(seeds=50, runs=4, actions=40):
+    """Random play over several runs per world (gates stay open across
+    resets), comparing every replanned route with dijkstra_cost() → mismatches."""
+    import random
+    from engine import GameState
+
+    bad = 0
+    for seed in range(seeds):
+        game = GameState(seed=seed, grid_w=12, grid_h=12)
+        hints = RouteHints(game)
+        rng = random.Random(seed)
+        for run in range(runs):
+            if run:
+                game.reset()
+            for _ in range(actions):
+                if game.ended:
+                    break
+                hints.update()
+                while not hints.done:
+                    hints.update()
+                path = hints.path()
+                expected = dijkstra_cost(game)
+                got = INF if path is None else hints.cost()
+                if got != expected or (path and (path[0], path[-1]) != (game.current, game.finish_room)):
+                    bad += 1
+                    print(f"seed {seed} run {run}: route costs {got}, expected {expected}")
+
+                d = rng.choice(list(game.rooms[game.current]["links"]))
+                if game.gate_open(d):
+                    game.step(("walk", d))
+                    continue
+                required_type = game.next_room_type(d)
+                chosen = [i for i, c in enumerate(game.cards) if c["type"] == required_type]
+                game.step(("open_gate", d, chosen, rng.randrange(2)))
+    return bad
+
+
+if __name__ == "__main__":
+    import sys
+    bad = check(int(sys.argv[1]) if len(sys.argv) > 1 else 50)
+    print("routes match Dijkstra" if not bad else f"{bad} mismatches")
+    sys.exit(1 if bad else 0)
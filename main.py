@@ -1,6 +1,22 @@
 import pygame
 import sys
-import random
+import os
+import time
+import json
+import hashlib
+import struct
+import io
+import queue
+import threading
+from collections import OrderedDict
+
+from engine import (
+    GameState, GRID_W, GRID_H, ROOM_TYPES,
+    CARD_TYPES, CARD_MIN_POWER, CARD_MAX_POWER, MAX_CARDS,
+    DIFFICULTY_EASY, DIFFICULTY_MEDIUM, DIFFICULTY_HARD, difficulty_settings,
+)
+from solver import reset_winnable
+from hints import RouteHints
 
 # =========================
 # CONFIG
@@ -97,6 +113,7 @@ If total power ≥ required power → gate can be opened
 - Circular visibility radius
 - Only rooms inside the circle are fully visible
 - Red outline = Escape room (always visible)
+- Press H to show the cheapest route to the Escape room
 
 11. STRATEGY
 Key decisions:
@@ -123,18 +140,46 @@ ROOM_ORIGINAL = 800
 ROOM_SCALE = 0.5
 ROOM_DRAW = int(ROOM_ORIGINAL * ROOM_SCALE)  # 512
 FPS = 60
+DIRTY_RECTS = True   # False → flip the whole window every frame
+IDLE_WAIT_MS = 500   # menus sleep on the event queue at most this long
+SURFACE_CACHE_DIR = ".cache/surfaces"   # None → always decode from assets/
+PCM_CACHE_DIR = ".cache/pcm"            # None → always decode sound files
+# path → write startup phase timings there as JSON and exit after the
+# first menu frame (used by bench_startup.py)
+STARTUP_REPORT = os.environ.get("GATEBOUND_STARTUP_REPORT")
+# fixed run seed (same seed → same world, hands and gates); unset → random
+def env_seed():
+    value = os.environ.get("GATEBOUND_SEED")
+    if not value:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        sys.exit(f"GATEBOUND_SEED must be an integer, got {value!r}")
+
+
+RUN_SEED = env_seed()
+# world size as "WxH"; rooms are generated on demand, so any size starts as fast
+def env_world():
+    value = os.environ.get("GATEBOUND_WORLD")
+    if not value:
+        return GRID_W, GRID_H
+    try:
+        w, h = (int(n) for n in value.lower().split("x"))
+    except ValueError:
+        sys.exit(f"GATEBOUND_WORLD must look like 30x20, got {value!r}")
+    if w < 1 or h < 1 or w * h < 2:
+        sys.exit(f"GATEBOUND_WORLD needs at least two rooms, got {value!r}")
+    return w, h
+
+
+WORLD_W, WORLD_H = env_world()
+PRINT_GRID_MAX = 20   # print_world_grid skips worlds wider / taller than this
 PLAYER_SPEED = 5
 DEBUG = False
 CARD_WIDTH  = 90
 CARD_HEIGHT = 160   # 180 × 16 / 9 ≈ 320
 footstep_timer = 0
-MAX_POINTS = 1000
-POINT_DECAY_PER_SEC = 1
-points = MAX_POINTS
-time_accumulator = 0
-GAME_OVER = False
-GAME_WIN = False
-GAME_ENDED = False
 
 prev_show_gate_popup = False
 CAN_PASS_DOOR = False
@@ -158,37 +203,8 @@ game_state = STATE_MENU
 # =========================
 # DIFFICULTY LEVELS
 # =========================
-DIFFICULTY_EASY = "easy"
-DIFFICULTY_MEDIUM = "medium"
-DIFFICULTY_HARD = "hard"
-
 current_difficulty = DIFFICULTY_EASY
 
-# Difficulty settings
-difficulty_settings = {
-    DIFFICULTY_EASY: {
-        "max_points": 1000,
-        "point_decay": 1,
-        "minimap_radius": 5,
-        "store_uses": 3,
-        "score_multiplier": 1
-    },
-    DIFFICULTY_MEDIUM: {
-        "max_points": 500,
-        "point_decay": 1,
-        "minimap_radius": 3,
-        "store_uses": 2,
-        "score_multiplier": 3
-    },
-    DIFFICULTY_HARD: {
-        "max_points": 300,
-        "point_decay": 1,
-        "minimap_radius": 2,
-        "store_uses": 1,
-        "score_multiplier": 5
-    }
-}
-
 CARDS_START_X = 20
 CARDS_GAP_X = 15
 CARDS_ROW_OVERLAP = 28
@@ -200,9 +216,6 @@ CARDS_PER_ROW = 4
 # =========================
 # STORE SYSTEM
 # =========================
-STORE_MAX_USES = 3
-store_uses_left = STORE_MAX_USES
-
 store_selected_indices = set()
 store_target_type = None
 
@@ -219,21 +232,6 @@ DIR_ROW = {
 selected_card_index = None
 show_swap_ui = False
 
-explored_rooms = set()
-
-
-
-GRID_W = 10
-GRID_H = 10
-
-visited_rooms = set()
-
-
-def get_random_room_id():
-    x = random.randint(0, GRID_W - 1)
-    y = random.randint(0, GRID_H - 1)
-    return room_id(x, y)
-
 
 
 # =========================
@@ -253,59 +251,11 @@ MENU_CONFIRM_NO_RECT  = pygame.Rect(0, 0, 0, 0)
 # =========================
 
 
-CARD_TYPES = ["Jungle", "Desert", "Ice", "Volcanic", "Arcane"]
-CARD_MIN_POWER = 1
-CARD_MAX_POWER = 9
-MAX_CARDS = 10
-
 selected_card_indices = set()
 gate_message = ""
 gate_message_timer = 0
 
 
-# Gate cards are now stored per room per direction
-# Format: gate_cards[room_id][direction] = {"power": X, "rewards": [...]}
-gate_cards = {}
-
-
-def get_or_create_gate_card(room_id, direction):
-    """Get existing gate card or create a new one for this specific room+direction"""
-    if room_id not in gate_cards:
-        gate_cards[room_id] = {}
-    
-    if direction not in gate_cards[room_id]:
-        # Create new gate card for this specific gate
-        power = random.randint(CARD_MIN_POWER, CARD_MAX_POWER)
-        rewards = []
-        for _ in range(2):
-            r = create_random_card()
-            r["power"] = power
-            rewards.append(r)
-        
-        gate_cards[room_id][direction] = {
-            "power": power,
-            "rewards": rewards
-        }
-    
-    return gate_cards[room_id][direction]
-
-
-
-
-
-
-def create_random_card():
-    return {
-        "type": random.choice(CARD_TYPES),
-        "power": random.randint(CARD_MIN_POWER, CARD_MAX_POWER)
-    }
-cards = []
-for _ in range(MAX_CARDS):
-    c = create_random_card()
-    c["power"] = random.randint(6, CARD_MAX_POWER)  # stronger start
-    cards.append(c)
-
-
 selected_reward_index = None
 
 
@@ -332,39 +282,50 @@ def wrap_text(text, font, max_w):
         if cur != "":
             lines_out.append(cur)
     return lines_out
-def draw_howto_screen():
-    global howto_scroll
-    screen.blit(menu_bg, (0, 0))
+# The How To Play page is laid out and rendered once: a static backdrop
+# (background, overlay, title, footer) and a tall transparent page with
+# both text columns. Scrolling is a single clipped blit of the page.
+HOWTO_TOP_MARGIN = 90
+HOWTO_BOTTOM_MARGIN = 60
+HOWTO_SIDE_MARGIN = 80
+HOWTO_COL_GAP = 60
+
+howto_backdrop = None
+howto_page = None
+howto_key = None   # (text, screen size) the surfaces were built for
+
+
+def build_howto_backdrop():
+    backdrop = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+    backdrop.blit(get_asset("menu_bg"), (0, 0))
     # --- dark overlay for readability ---
-    overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-    overlay.fill((0, 0, 0, 160))  # alpha: 120–180 is ideal
-    screen.blit(overlay, (0, 0))
-    
-    # Background only
+    overlay = get_fill_surface((SCREEN_WIDTH, SCREEN_HEIGHT), (0, 0, 0, 160))  # alpha: 120–180 is ideal
+    backdrop.blit(overlay, (0, 0))
 
     # ===== TITLE =====
     title = retro_font.render("HOW TO PLAY", True, (255, 255, 255))
-    screen.blit(
+    backdrop.blit(
         title,
         (SCREEN_WIDTH // 2 - title.get_width() // 2, 30)
     )
 
-    # ===== CONTENT AREA (FULL SCREEN) =====
-    top_margin = 90
-    bottom_margin = 60
-    side_margin = 80
+    # ===== FOOTER =====
+    hint = retro_small.render(
+        "ESC - Back   |   Mouse Wheel / ↑ ↓ to Scroll",
+        True, (180, 180, 180)
+    )
+    backdrop.blit(
+        hint,
+        (SCREEN_WIDTH // 2 - hint.get_width() // 2,
+         SCREEN_HEIGHT - 30)
+    )
+    return backdrop
 
-    content_x = side_margin
-    content_y = top_margin
-    content_w = SCREEN_WIDTH - side_margin * 2
-    content_h = SCREEN_HEIGHT - top_margin - bottom_margin
 
+def build_howto_page(content_w):
     # Columns
-    col_gap = 60
-    col_w = (content_w - col_gap) // 2
-
-    left_x = content_x
-    right_x = content_x + col_w + col_gap
+    col_w = (content_w - HOWTO_COL_GAP) // 2
+    right_x = col_w + HOWTO_COL_GAP
 
     # ===== TEXT =====
     lines = wrap_text(HOWTO_TEXT, retro_small, col_w)
@@ -375,58 +336,102 @@ def draw_howto_screen():
     left_lines = lines[:half]
     right_lines = lines[half:]
 
-    content_total_h = max(len(left_lines), len(right_lines)) * line_h
-    max_scroll = max(0, content_total_h - content_h)
-    howto_scroll = max(0, min(howto_scroll, max_scroll))
-
-    clip = pygame.Rect(content_x, content_y, content_w, content_h)
-    old_clip = screen.get_clip()
-    screen.set_clip(clip)
+    page_h = max(len(left_lines), len(right_lines)) * line_h
+    page = pygame.Surface((content_w, max(page_h, 1)), pygame.SRCALPHA)
 
     # LEFT COLUMN
-    y = content_y - howto_scroll
-    for ln in left_lines:
-        screen.blit(render_howto_line(ln), (left_x, y))
-        y += line_h
+    for i, ln in enumerate(left_lines):
+        page.blit(render_howto_line(ln), (0, i * line_h))
 
     # RIGHT COLUMN
-    y = content_y - howto_scroll
-    for ln in right_lines:
-        screen.blit(render_howto_line(ln), (right_x, y))
-        y += line_h
+    for i, ln in enumerate(right_lines):
+        page.blit(render_howto_line(ln), (right_x, i * line_h))
 
-    screen.set_clip(old_clip)
+    return page
 
-    # ===== FOOTER =====
-    hint = retro_small.render(
-        "ESC - Back   |   Mouse Wheel / ↑ ↓ to Scroll",
-        True, (180, 180, 180)
-    )
+
+def draw_howto_screen():
+    global howto_scroll, howto_backdrop, howto_page, howto_key
+
+    # ===== CONTENT AREA (FULL SCREEN) =====
+    content_x = HOWTO_SIDE_MARGIN
+    content_y = HOWTO_TOP_MARGIN
+    content_w = SCREEN_WIDTH - HOWTO_SIDE_MARGIN * 2
+    content_h = SCREEN_HEIGHT - HOWTO_TOP_MARGIN - HOWTO_BOTTOM_MARGIN
+
+    key = (HOWTO_TEXT, SCREEN_WIDTH, SCREEN_HEIGHT)
+    if key != howto_key:
+        howto_backdrop = build_howto_backdrop()
+        howto_page = build_howto_page(content_w)
+        howto_key = key
+
+    max_scroll = max(0, howto_page.get_height() - content_h)
+    howto_scroll = max(0, min(howto_scroll, max_scroll))
+
+    screen.blit(howto_backdrop, (0, 0))
     screen.blit(
-        hint,
-        (SCREEN_WIDTH // 2 - hint.get_width() // 2,
-         SCREEN_HEIGHT - 30)
+        howto_page,
+        (content_x, content_y),
+        (0, howto_scroll, content_w, content_h)
     )
 
 
+# =========================
+# STARTUP PROFILE
+# =========================
+# Named timestamps taken while the game boots. Each phase lasts from the
+# previous mark to its own.
+startup_marks = [("start", time.perf_counter())]
+
+
+def mark_startup(phase):
+    if startup_marks is not None:
+        startup_marks.append((phase, time.perf_counter()))
+
+
+def finish_startup_report():
+    """Write the phase breakdown to STARTUP_REPORT and quit."""
+    mark_startup("first_menu_frame")
+
+    # background streaming started with the menu; time it to completion
+    while assets_streaming():
+        pump_asset_loader()
+        pygame.time.wait(1)
+    mark_startup("background_assets")
+
+    phases = [
+        {"phase": name, "ms": round((t - prev) * 1000, 3)}
+        for (_, prev), (name, t) in zip(startup_marks, startup_marks[1:])
+    ]
+    first_frame = dict(startup_marks)["first_menu_frame"]
+    report = {
+        "phases": phases,
+        "first_menu_frame_ms": round((first_frame - startup_marks[0][1]) * 1000, 3),
+        "pygame": pygame.version.ver,
+        "python": sys.version.split()[0],
+    }
+    with open(STARTUP_REPORT, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+
+    pygame.quit()
+    sys.exit()
+
+
 # =========================
 # INIT
 # =========================
 pygame.init()
+mark_startup("pygame_init")
 pygame.mixer.init(
     frequency=44100,
     size=-16,
     channels=2,
     buffer=512
 )
+mark_startup("mixer_init")
 
 screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-idle_sheet = pygame.image.load("assets/player_idle.png").convert_alpha()
-walk_sheet = pygame.image.load("assets/player_walk.png").convert_alpha()
-
-
-menu_confirm_bg = pygame.image.load("assets/buttons/Asset 6.png").convert_alpha()
-menu_confirm_bg = pygame.transform.smoothscale(menu_confirm_bg, (400, 200))
+mark_startup("display")
 
 
 pygame.display.set_caption("Tower Puzzle — Rooms (10x10)")
@@ -438,6 +443,394 @@ retro_font = pygame.font.Font("assets/retro.ttf", 26)
 retro_small = pygame.font.Font("assets/retro.ttf", 16)
 retro_power = pygame.font.Font("assets/retro.ttf", 48)  # ← change 48
 menu_font = pygame.font.Font("assets/retro.ttf", 26)
+
+# =========================
+# SURFACE POOL
+# =========================
+# Translucent fills (overlays, shadows, glows) are allocated once per
+# (size, colour) and reused every frame. Never draw onto these.
+fill_surfaces = {}   # (size, rgba) → SRCALPHA surface
+
+
+def get_fill_surface(size, color):
+    key = (tuple(size), tuple(color))
+    surf = fill_surfaces.get(key)
+    if surf is None:
+        surf = pygame.Surface(size, pygame.SRCALPHA)
+        surf.fill(color)
+        fill_surfaces[key] = surf
+    return surf
+
+
+# =========================
+# SCALED ASSETS
+# =========================
+# UI helpers that scale at draw time go through here, so each
+# (source asset, target size) pair is smoothscaled only once.
+SCALED_CACHE_SIZE = 64
+scaled_cache = OrderedDict()   # (source surface, (w, h)) → scaled surface
+
+
+def get_scaled(img, size):
+    key = (img, tuple(size))
+    scaled = scaled_cache.get(key)
+    if scaled is None:
+        scaled = pygame.transform.smoothscale(img, size)
+        scaled_cache[key] = scaled
+        if len(scaled_cache) > SCALED_CACHE_SIZE:
+            scaled_cache.popitem(last=False)   # least recently used
+    else:
+        scaled_cache.move_to_end(key)
+    return scaled
+
+
+# =========================
+# TEXT CACHE
+# =========================
+# Finished (outlined) text surfaces, keyed by everything that affects the
+# pixels. Static labels and slow-changing counters become a single blit.
+TEXT_CACHE_SIZE = 256
+text_cache = OrderedDict()   # (font, text, color, outline_color, outline) → (surf, w, h)
+
+
+def render_outlined(font, text, color=(255, 255, 255), outline_color=(0, 0, 0), outline=2):
+    """Returns (surface, text_w, text_h). The surface is padded by `outline` px."""
+    key = (font, text, color, outline_color, outline)
+    cached = text_cache.get(key)
+    if cached is not None:
+        text_cache.move_to_end(key)
+        return cached
+
+    main = font.render(text, True, color)
+    w, h = main.get_size()
+
+    if outline:
+        shadow = font.render(text, True, outline_color)
+        surf = pygame.Surface((w + outline * 2, h + outline * 2), pygame.SRCALPHA)
+        for ox, oy in [(-outline,0),(outline,0),(0,-outline),(0,outline)]:
+            surf.blit(shadow, (outline + ox, outline + oy))
+        surf.blit(main, (outline, outline))
+    else:
+        surf = main
+
+    cached = (surf, w, h)
+    text_cache[key] = cached
+    if len(text_cache) > TEXT_CACHE_SIZE:
+        text_cache.popitem(last=False)   # least recently used
+    return cached
+
+
+def draw_outlined_text(font, text, x, y, color=(255, 255, 255), outline_color=(0, 0, 0), outline=2):
+    """Blits cached text so that the text itself (not the outline) starts at (x, y)."""
+    surf, _, _ = render_outlined(font, text, color, outline_color, outline)
+    screen.blit(surf, (x - outline, y - outline))
+
+# =========================
+# ASSETS
+# =========================
+# Images and sounds are registered by name and only decoded on first
+# get_asset(). Image spec keys:
+#   path   file to load           alpha  convert_alpha() (default) or convert()
+#   source reuse another asset    size   smoothscale to (w, h)
+#   width  smoothscale to this width, keeping the aspect ratio
+# Sound specs use sound (file); music specs use music (file, kept as bytes).
+ASSET_SPECS = {}
+assets = {}   # name → loaded Surface / Sound
+
+
+# Decoded + scaled pixels of file-backed images are kept in
+# SURFACE_CACHE_DIR as raw tobytes() dumps, so later launches skip the
+# PNG/JPEG decode and the smoothscale. Files are keyed by the source
+# file's sha1, the target size and the pixel format; a changed asset
+# simply gets a new file.
+CACHE_HEADER = struct.Struct("<II")   # width, height
+
+
+def surface_cache_path(spec):
+    with open(spec["path"], "rb") as f:
+        digest = hashlib.sha1(f.read()).hexdigest()
+
+    if "width" in spec:
+        target = f"w{spec['width']}"
+    elif "size" in spec:
+        target = "{}x{}".format(*spec["size"])
+    else:
+        target = "full"
+
+    fmt = "RGBA" if spec.get("alpha", True) else "RGB"
+    return os.path.join(SURFACE_CACHE_DIR, f"{digest}_{target}_{fmt}.raw"), fmt
+
+
+def load_cached_surface(path, fmt):
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+    except OSError:
+        return None
+
+    if len(data) < CACHE_HEADER.size:
+        return None
+    w, h = CACHE_HEADER.unpack_from(data)
+    pixels = data[CACHE_HEADER.size:]
+    if len(pixels) != w * h * len(fmt):
+        return None   # truncated write → decode again
+
+    return pygame.image.frombytes(pixels, (w, h), fmt)
+
+
+def save_cached_surface(path, fmt, img):
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = path + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(CACHE_HEADER.pack(*img.get_size()))
+            f.write(pygame.image.tobytes(img, fmt))
+        os.replace(tmp, path)
+    except OSError:
+        pass   # read-only install: just decode every launch
+
+
+def scale_asset(img, spec):
+    size = spec.get("size")
+    if "width" in spec:
+        w = spec["width"]
+        size = (w, int(img.get_height() * (w / img.get_width())))
+    if size is not None:
+        img = pygame.transform.smoothscale(img, size)
+    return img
+
+
+# Loading is split so the slow half can run on the streaming thread:
+# decode_asset() reads, decodes and scales without touching the display;
+# finish_asset() does the display-dependent convert() on the main thread.
+# Scaling before convert() gives the same pixels as the other way round.
+def decode_asset(name):
+    spec = ASSET_SPECS[name]
+
+    if "sound" in spec:
+        return load_sound(name, spec["sound"])
+
+    if "music" in spec:
+        with open(spec["music"], "rb") as f:
+            return f.read()
+
+    fmt = "RGBA" if spec.get("alpha", True) else "RGB"
+    cache = None
+    if SURFACE_CACHE_DIR:
+        cache, fmt = surface_cache_path(spec)
+        img = load_cached_surface(cache, fmt)
+        if img is not None:
+            return img, fmt, None
+
+    img = pygame.image.load(spec["path"])
+    # plain 24/32-bit copy so smoothscale works on paletted files too
+    img = pygame.image.frombytes(pygame.image.tobytes(img, fmt), img.get_size(), fmt)
+    return scale_asset(img, spec), fmt, cache
+
+
+def finish_asset(name, decoded):
+    spec = ASSET_SPECS[name]
+    if "path" not in spec:
+        return decoded
+
+    img, fmt, cache = decoded
+    img = img.convert_alpha() if fmt == "RGBA" else img.convert()
+    if cache is not None:
+        save_cached_surface(cache, fmt, img)
+    return img
+
+
+def load_asset(name):
+    spec = ASSET_SPECS[name]
+    if "source" in spec:
+        return scale_asset(get_asset(spec["source"]), spec)
+    return finish_asset(name, decode_asset(name))
+
+
+def get_asset(name):
+    asset = assets.get(name)
+    if asset is None:
+        asset = load_asset(name)
+        assets[name] = asset
+    return asset
+
+
+def play_sfx(name):
+    get_asset(name).play()
+
+
+# Scenes list what they draw so it is decoded before their first frame.
+SCENE_ASSETS = {}
+loaded_scenes = set()
+
+
+def preload_scene(scene):
+    if scene in loaded_scenes:
+        return
+    for name in SCENE_ASSETS.get(scene, ()):
+        get_asset(name)
+    loaded_scenes.add(scene)
+
+
+# =========================
+# ASSET STREAMING
+# =========================
+# A daemon thread runs decode_asset() for queued names; the main thread
+# picks results up in pump_asset_loader() and finishes them. Aliases
+# ("source" specs) are cheap and resolve on the main thread. Failed
+# files are left for get_asset() to load again and raise normally.
+# A name leaves asset_pending only after its result is queued.
+asset_requests = queue.Queue()
+asset_results = queue.Queue()
+asset_pending = set()   # queued or decoding
+asset_failed = set()
+asset_thread = None
+
+
+def asset_worker():
+    while True:
+        name = asset_requests.get()
+        try:
+            asset_results.put((name, decode_asset(name)))
+        except Exception:   # anything, e.g. a corrupt cache entry; get_asset() retries
+            asset_failed.add(name)
+        finally:
+            asset_pending.discard(name)
+
+
+def stream_assets(names):
+    global asset_thread
+
+    if asset_thread is None or not asset_thread.is_alive():
+        asset_thread = threading.Thread(target=asset_worker, daemon=True)
+        asset_thread.start()
+
+    for name in names:
+        spec = ASSET_SPECS[name]
+        if "source" in spec:
+            stream_assets([spec["source"]])
+            continue
+        if name in assets or name in asset_pending or name in asset_failed:
+            continue
+        asset_pending.add(name)
+        asset_requests.put(name)
+
+
+def pump_asset_loader():
+    while True:
+        try:
+            name, result = asset_results.get_nowait()
+        except queue.Empty:
+            return
+
+        if name not in assets:   # may have been loaded synchronously meanwhile
+            assets[name] = finish_asset(name, result)
+
+
+def asset_settled(name):
+    spec = ASSET_SPECS[name]
+    if "source" in spec:
+        return asset_settled(spec["source"])
+    return name in assets or name in asset_failed
+
+
+def assets_streaming():
+    if asset_thread is not None and not asset_thread.is_alive():
+        asset_pending.clear()   # worker died: get_asset() loads the rest on demand
+    return bool(asset_pending) or not asset_results.empty()
+
+
+# =========================
+# UI ATLAS
+# =========================
+# Once a scene's assets are in, its button / panel images are shelf-packed
+# into one surface. Identical sources (the difficulty buttons are all
+# Asset 5.png) share a region. Members are then served as subsurfaces of
+# the atlas and draw_ui() blits straight from it by name.
+UI_ATLAS = {
+    STATE_MENU: [
+        "btn_1", "btn_3", "cursor_img",
+        "btn_easy", "btn_medium", "btn_hard",
+        "btn_easy_h", "btn_medium_h", "btn_hard_h",
+    ],
+    STATE_GAME: [
+        "msg_bg", "hud_bg", "hud_bg_sidebar", "menu_confirm_bg",
+        "close_btn_img", "store_popup_img", "world_border_img",
+    ],
+}
+UI_ATLAS_MAX_W = 1024
+UI_ATLAS_PAD = 1
+
+ui_atlases = {}   # scene → atlas surface
+ui_regions = {}   # asset name → (atlas surface, region rect)
+
+
+def shelf_pack(sizes, max_w, pad=UI_ATLAS_PAD):
+    """Place (w, h) boxes in rows, tallest first → (positions, atlas size)."""
+    positions = [None] * len(sizes)
+    x = y = shelf_h = atlas_w = 0
+
+    for i in sorted(range(len(sizes)), key=lambda i: -sizes[i][1]):
+        w, h = sizes[i]
+        if x and x + w > max_w:
+            x = 0
+            y += shelf_h + pad
+            shelf_h = 0
+        positions[i] = (x, y)
+        x += w + pad
+        atlas_w = max(atlas_w, x - pad)
+        shelf_h = max(shelf_h, h)
+
+    return positions, (atlas_w, y + shelf_h)
+
+
+def build_ui_atlas(scene):
+    if scene in ui_atlases or scene not in UI_ATLAS:
+        return
+
+    sources = []        # unique images, packing order
+    source_of = {}      # member name → index into sources
+    seen = {}           # (size, pixel digest) → index into sources
+    for name in UI_ATLAS[scene]:
+        img = get_asset(name)
+        key = (img.get_size(), hashlib.sha1(pygame.image.tobytes(img, "RGBA")).digest())
+        if key not in seen:
+            seen[key] = len(sources)
+            sources.append(img)
+        source_of[name] = seen[key]
+
+    positions, size = shelf_pack([img.get_size() for img in sources], UI_ATLAS_MAX_W)
+    atlas = pygame.Surface(size, pygame.SRCALPHA).convert_alpha()
+    atlas.fill((0, 0, 0, 0))
+
+    regions = []
+    for img, pos in zip(sources, positions):
+        # ADD onto transparent black is an exact copy, alpha included
+        atlas.blit(img, pos, special_flags=pygame.BLEND_RGBA_ADD)
+        rect = pygame.Rect(pos, img.get_size())
+        regions.append((rect, atlas.subsurface(rect)))
+
+    for name, i in source_of.items():
+        rect, sub = regions[i]
+        ui_regions[name] = (atlas, rect)
+        assets[name] = sub   # the separate surface can now be freed
+    ui_atlases[scene] = atlas
+
+
+def draw_ui(name, pos):
+    region = ui_regions.get(name)
+    if region is None:   # scene not packed yet
+        screen.blit(get_asset(name), pos)
+    else:
+        screen.blit(region[0], pos, region[1])
+
+
+ASSET_SPECS.update({
+    "idle_sheet": {"path": "assets/player_idle.png"},
+    "walk_sheet": {"path": "assets/player_walk.png"},
+    "menu_confirm_bg": {"path": "assets/buttons/Asset 6.png", "size": (400, 200)},
+})
+
 # =========================
 # AUDIO
 # =========================
@@ -448,20 +841,84 @@ MUSIC_GAME = "assets/audio/music/gameplay.mp3"
 MUSIC_WIN  = "assets/audio/music/victory.mp3"
 
 # --- Sound Effects ---
-SFX_CLICK       = pygame.mixer.Sound("assets/audio/sfx/click.wav")
-SFX_GATE_OPEN   = pygame.mixer.Sound("assets/audio/sfx/gate_open.mp3")
-SFX_CARD_SELECT = pygame.mixer.Sound("assets/audio/sfx/card_select.mp3")
-SFX_SWAP        = pygame.mixer.Sound("assets/audio/sfx/swap.mp3")
-SFX_FOOTSTEP    = pygame.mixer.Sound("assets/audio/sfx/footstep.mp3")
+# Effects are not part of any scene: each one is decoded the first time
+# play_sfx() asks for it.
+ASSET_SPECS.update({
+    "sfx_click":       {"sound": "assets/audio/sfx/click.wav"},
+    "sfx_gate_open":   {"sound": "assets/audio/sfx/gate_open.mp3"},
+    "sfx_card_select": {"sound": "assets/audio/sfx/card_select.mp3"},
+    "sfx_swap":        {"sound": "assets/audio/sfx/swap.mp3"},
+    "sfx_footstep":    {"sound": "assets/audio/sfx/footstep.mp3"},
+})
+
+# Volumes (the only place they are set)
+SOUND_VOLUMES = {
+    "music":           0.4,
+    "sfx_click":       0.6,
+    "sfx_gate_open":   0.6,
+    "sfx_card_select": 0.6,
+    "sfx_swap":        0.6,
+    "sfx_footstep":    0.6,
+}
+pygame.mixer.music.set_volume(SOUND_VOLUMES["music"])
+
+
+# Decoded PCM is cached in PCM_CACHE_DIR so later launches build the
+# Sound straight from raw samples instead of decoding the MP3 again.
+# Files are keyed by the source sha1 and the mixer format, since
+# get_raw() data is only valid for the format it was decoded to.
+def pcm_cache_path(path):
+    with open(path, "rb") as f:
+        digest = hashlib.sha1(f.read()).hexdigest()
+    freq, size, channels = pygame.mixer.get_init()
+    return os.path.join(PCM_CACHE_DIR, f"{digest}_{freq}_{size}_{channels}.pcm")
+
+
+def load_sound(name, path):
+    cache = pcm_cache_path(path) if PCM_CACHE_DIR else None
+
+    snd = None
+    if cache is not None:
+        try:
+            with open(cache, "rb") as f:
+                snd = pygame.mixer.Sound(buffer=f.read())
+        except OSError:
+            pass
+
+    if snd is None:
+        snd = pygame.mixer.Sound(path)
+        if cache is not None:
+            try:
+                os.makedirs(PCM_CACHE_DIR, exist_ok=True)
+                with open(cache + ".tmp", "wb") as f:
+                    f.write(snd.get_raw())
+                os.replace(cache + ".tmp", cache)
+            except OSError:
+                pass
+
+    snd.set_volume(SOUND_VOLUMES.get(name, 1.0))
+    return snd
+
+# track path → asset holding the file bytes (streamed ahead of time)
+MUSIC_ASSETS = {
+    MUSIC_MENU: "music_menu",
+    MUSIC_GAME: "music_game",
+    MUSIC_WIN: "music_win",
+}
+for track, name in MUSIC_ASSETS.items():
+    ASSET_SPECS[name] = {"music": track}
 
-# Volumes
-pygame.mixer.music.set_volume(0.4)
-for s in [SFX_CLICK, SFX_GATE_OPEN, SFX_CARD_SELECT, SFX_SWAP, SFX_FOOTSTEP]:
-    s.set_volume(0.6)
 
 def play_music(track, loop=True):
     pygame.mixer.music.stop()
-    pygame.mixer.music.load(track)
+    data = assets.get(MUSIC_ASSETS.get(track))
+    try:
+        if data is not None:
+            pygame.mixer.music.load(io.BytesIO(data), os.path.splitext(track)[1][1:])
+        else:
+            pygame.mixer.music.load(track)
+    except (pygame.error, OSError):
+        return   # missing / unreadable track → play on without music
     pygame.mixer.music.play(-1 if loop else 0)
 
 def stop_music():
@@ -470,66 +927,45 @@ def stop_music():
 # =========================
 # MENU ASSETS
 # =========================
-menu_bg = pygame.image.load("assets/bg.png").convert()
-menu_bg = pygame.transform.smoothscale(menu_bg, (SCREEN_WIDTH, SCREEN_HEIGHT))
-
-logo_img = pygame.image.load("assets/logo.png").convert_alpha()
-
 # optional scale
 LOGO_W = 520
-LOGO_H = int(logo_img.get_height() * (LOGO_W / logo_img.get_width()))
-logo_img = pygame.transform.smoothscale(logo_img, (LOGO_W, LOGO_H))
-
-
-btn_1= pygame.image.load("assets/buttons/Asset 5.png").convert_alpha()
-# btn_start_hover = pygame.image.load("assets/btn_start_hover.png").convert_alpha()
-
-btn_2= pygame.image.load("assets/buttons/Asset 2.png").convert_alpha()
-# btn_howto_hover = pygame.image.load("assets/btn_howto_hover.png").convert_alpha()
-
-btn_3= pygame.image.load("assets/buttons/Asset 4.png").convert_alpha()
-# btn_quit_hover = pygame.image.load("assets/btn_quit_hover.png").convert_alpha()
 
-msg_bg = pygame.image.load("assets/buttons/Asset 6.png").convert_alpha()
-msg_bg = pygame.transform.smoothscale(msg_bg, (420, 90))
-
-cursor_img = pygame.image.load("assets/buttons/mouse.png").convert_alpha()
-pygame.mouse.set_visible(False)
-
-hud_bg = pygame.image.load("assets/buttons/Asset 7.png").convert_alpha()
 HUD_W = 280
 HUD_H = 140
-hud_bg = pygame.transform.smoothscale(hud_bg, (HUD_W, HUD_H))
 HUD_FONT_BIG = pygame.font.Font("assets/retro.ttf", 28)   # POINTS
 HUD_FONT_NORMAL = pygame.font.Font("assets/retro.ttf", 22)
 
+MINIMAP_SIZE = 160
 
-sidebar_bg = pygame.image.load("assets/leftbg.png").convert_alpha()
-sidebar_bg = pygame.transform.smoothscale(
-    sidebar_bg,
-    (SIDEBAR_W, SCREEN_HEIGHT)
-)
-bg_world = pygame.image.load("assets/rightbg.png").convert()
-bg_world = pygame.transform.smoothscale(
-    bg_world,
-    (ROOM_DRAW + PREVIEW_MARGIN * 2,
-     ROOM_DRAW + PREVIEW_MARGIN * 2)
-)
-STORE_BASE_Y = SCREEN_HEIGHT - 140
-STORE_BTN_RECT = pygame.Rect(20, STORE_BASE_Y + 65,btn_1.get_width(),btn_1.get_height())
+ASSET_SPECS.update({
+    "menu_bg":  {"path": "assets/bg.png", "alpha": False, "size": (SCREEN_WIDTH, SCREEN_HEIGHT)},
+    "logo_img": {"path": "assets/logo.png", "width": LOGO_W},
 
-world_border_img = pygame.image.load("assets/buttons/border.png").convert_alpha()
-world_border_img = pygame.transform.smoothscale(
-    world_border_img,
-    (ROOM_DRAW + PREVIEW_MARGIN * 2, ROOM_DRAW + PREVIEW_MARGIN * 2)
-)
+    "btn_1": {"path": "assets/buttons/Asset 5.png"},
+    "btn_2": {"path": "assets/buttons/Asset 2.png"},
+    "btn_3": {"path": "assets/buttons/Asset 4.png"},
 
-minimap_bg = pygame.image.load("assets/minimap.png").convert_alpha()
-MINIMAP_SIZE = 160
-minimap_bg = pygame.transform.smoothscale(
-    minimap_bg,
-    (MINIMAP_SIZE, MINIMAP_SIZE)
-)
+    "msg_bg":     {"path": "assets/buttons/Asset 6.png", "size": (420, 90)},
+    "cursor_img": {"path": "assets/buttons/mouse.png"},
+    "hud_bg":     {"path": "assets/buttons/Asset 7.png", "size": (HUD_W, HUD_H)},
+
+    "sidebar_bg": {"path": "assets/leftbg.png", "size": (SIDEBAR_W, SCREEN_HEIGHT)},
+    "bg_world": {
+        "path": "assets/rightbg.png",
+        "alpha": False,
+        "size": (ROOM_DRAW + PREVIEW_MARGIN * 2, ROOM_DRAW + PREVIEW_MARGIN * 2),
+    },
+    "world_border_img": {
+        "path": "assets/buttons/border.png",
+        "size": (ROOM_DRAW + PREVIEW_MARGIN * 2, ROOM_DRAW + PREVIEW_MARGIN * 2),
+    },
+    "minimap_bg": {"path": "assets/minimap.png", "size": (MINIMAP_SIZE, MINIMAP_SIZE)},
+})
+
+pygame.mouse.set_visible(False)
+
+STORE_BASE_Y = SCREEN_HEIGHT - 140
+STORE_BTN_RECT = pygame.Rect((20, STORE_BASE_Y + 65), get_asset("btn_1").get_size())
 
 
 
@@ -543,10 +979,7 @@ LOGO_TOP_Y = -40
 LOGO_GAP = -40
 
 
-hud_bg_sidebar = pygame.transform.smoothscale(
-    hud_bg,
-    (SIDEBAR_HUD_W, SIDEBAR_HUD_H)
-)
+ASSET_SPECS["hud_bg_sidebar"] = {"source": "hud_bg", "size": (SIDEBAR_HUD_W, SIDEBAR_HUD_H)}
 
 
 menu_buttons = {
@@ -562,7 +995,7 @@ player_frame = 0
 anim_timer = 0
 moving = False
 
-btn_w, btn_h = btn_1.get_size()
+btn_w, btn_h = get_asset("btn_1").get_size()
 
 menu_buttons = {
     "start": pygame.Rect(SCREEN_WIDTH//2 - btn_w//2, 280, btn_w, btn_h),
@@ -571,9 +1004,22 @@ menu_buttons = {
 }
 
 
+# Visual bounds + optical centre per loaded UI image. The mask scan
+# walks every pixel, so it runs once per image and is stored here.
+image_bounds = {}   # surface → (visual rect, optical centre)
+
+
+def get_visual_bounds(img):
+    bounds = image_bounds.get(img)
+    if bounds is None:
+        visual = pygame.mask.from_surface(img).get_bounding_rects()[0]
+        bounds = (visual, visual.center)
+        image_bounds[img] = bounds
+    return bounds
+
+
 def get_visual_rect(img):
-    mask = pygame.mask.from_surface(img)
-    return mask.get_bounding_rects()[0]
+    return get_visual_bounds(img)[0]
 
 def draw_button(img, rect, text, font, text_color=(255,255,255)):
     img_x = rect.centerx - img.get_width() // 2
@@ -590,14 +1036,50 @@ def draw_button(img, rect, text, font, text_color=(255,255,255)):
                           rect.centery - main.get_height()//2))
 
 
-def get_player_frame(direction, frame, moving):
-    row = DIR_ROW[direction]
-    sheet = walk_sheet if moving else idle_sheet
+# =========================
+# ANIMATION TABLES
+# =========================
+# Sheets are sliced once into per-direction lists of standalone surfaces.
+# frame_ticks = game frames each animation frame stays on screen
+# (None → hold the first frame).
+def slice_sheet(sheet, frames=FRAMES_PER_ROW, size=FRAME_SIZE):
+    table = {}
+    for direction, row in DIR_ROW.items():
+        table[direction] = [
+            sheet.subsurface((i * size, row * size, size, size)).copy()
+            for i in range(frames)
+        ]
+    return table
+
+
+PLAYER_ANIMATIONS = {
+    "idle": {"sheet": "idle_sheet", "frame_ticks": None},
+    "walk": {"sheet": "walk_sheet", "frame_ticks": 8},
+}
+
 
-    x = frame * FRAME_SIZE
-    y = row * FRAME_SIZE
+def get_animation_frames(name):
+    anim = PLAYER_ANIMATIONS[name]
+    if "frames" not in anim:
+        anim["frames"] = slice_sheet(get_asset(anim["sheet"]))
+    return anim["frames"]
 
-    return sheet.subsurface((x, y, FRAME_SIZE, FRAME_SIZE))
+
+def advance_animation(name, frame, timer):
+    """Step an animation by one game frame → (frame, timer)."""
+    anim = PLAYER_ANIMATIONS[name]
+    if anim["frame_ticks"] is None:
+        return 0, 0
+
+    timer += 1
+    if timer >= anim["frame_ticks"]:
+        timer = 0
+        frame = (frame + 1) % len(get_animation_frames(name)["bottom"])
+    return frame, timer
+
+
+def get_player_frame(direction, frame, moving):
+    return get_animation_frames("walk" if moving else "idle")[direction][frame]
 
 
 show_store_popup = False
@@ -605,22 +1087,21 @@ show_store_popup = False
 # =========================
 # ROOM TYPES + BG
 # =========================
-ROOM_TYPES = ["Jungle", "Desert", "Ice", "Volcanic", "Arcane"]
+# room type → background asset name
+ROOM_BG = {t: "bg_" + t.lower() for t in ROOM_TYPES}
+
+for t in ROOM_TYPES:
+    ASSET_SPECS[ROOM_BG[t]] = {
+        "path": f"assets/bg_{t.lower()}.png",
+        "alpha": False,
+        "size": (ROOM_DRAW, ROOM_DRAW),
+    }
 
-BG_RAW = {
-    "Jungle": pygame.image.load("assets/bg_jungle.png").convert(),
-    "Desert": pygame.image.load("assets/bg_desert.png").convert(),
-    "Ice": pygame.image.load("assets/bg_ice.png").convert(),
-    "Volcanic": pygame.image.load("assets/bg_volcanic.png").convert(),
-    "Arcane": pygame.image.load("assets/bg_arcane.png").convert(),
-}
-card_images = {
-    "jungle": pygame.image.load("assets/card_jungle.jpeg").convert_alpha(),
-    "desert": pygame.image.load("assets/card_desert.jpeg").convert_alpha(),
-    "ice": pygame.image.load("assets/card_ice.jpeg").convert_alpha(),
-    "volcanic": pygame.image.load("assets/card_volcanic.jpeg").convert_alpha(),
-    "arcane": pygame.image.load("assets/card_arcane.jpeg").convert_alpha(),
-}
+for key in ["jungle", "desert", "ice", "volcanic", "arcane"]:
+    ASSET_SPECS["card_" + key] = {
+        "path": f"assets/card_{key}.jpeg",
+        "size": (CARD_WIDTH, CARD_HEIGHT),
+    }
 CARD_IMAGE_KEY = {
     "Jungle": "jungle",
     "Desert": "desert",
@@ -629,6 +1110,50 @@ CARD_IMAGE_KEY = {
     "Arcane": "arcane",
 }
 
+# =========================
+# CARD FACE ATLAS
+# =========================
+# Every TYPE × POWER card face (image + outlined power) baked into one
+# surface on first use. Rows are card types, columns are powers; the
+# second block of rows holds the "usable for this gate" glow variant.
+card_atlas = None
+
+
+def get_card_face_rect(card_type, power, glow=False):
+    row = CARD_TYPES.index(card_type) + (len(CARD_TYPES) if glow else 0)
+    col = power - CARD_MIN_POWER
+    return pygame.Rect(col * CARD_WIDTH, row * CARD_HEIGHT, CARD_WIDTH, CARD_HEIGHT)
+
+
+def build_card_atlas():
+    powers = range(CARD_MIN_POWER, CARD_MAX_POWER + 1)
+    atlas = pygame.Surface(
+        (len(powers) * CARD_WIDTH, len(CARD_TYPES) * 2 * CARD_HEIGHT)
+    ).convert()
+
+    glow = get_fill_surface((CARD_WIDTH, CARD_HEIGHT), (255, 255, 255, 50))
+
+    for card_type in CARD_TYPES:
+        img = get_asset("card_" + CARD_IMAGE_KEY[card_type])
+        for power in powers:
+            text, text_w, text_h = render_outlined(retro_power, str(power))
+            for is_glow in (False, True):
+                rect = get_card_face_rect(card_type, power, is_glow)
+                atlas.blit(img, rect.topleft)
+                if is_glow:
+                    atlas.blit(glow, rect.topleft)
+                atlas.blit(text, (rect.centerx - text_w // 2 - 2,
+                                  rect.centery - text_h // 2 - 2))
+    return atlas
+
+
+def draw_card_face(card_type, power, x, y, glow=False):
+    global card_atlas
+    if card_atlas is None:
+        card_atlas = build_card_atlas()
+    screen.blit(card_atlas, (x, y), get_card_face_rect(card_type, power, glow))
+
+
 ROOM_COLORS = {
     "Jungle":   (60, 160, 90),
     "Desert":   (210, 190, 90),
@@ -643,49 +1168,47 @@ passed_free_gate = {
     "left": False,
     "right": False,
 }
-store_popup_img = pygame.image.load("assets/buttons/menubg.png").convert_alpha()
-store_popup_img = pygame.transform.smoothscale(store_popup_img, (420, 420))
-
-btn_easy   = pygame.image.load("assets/buttons/Asset 5.png").convert_alpha()
-btn_medium = pygame.image.load("assets/buttons/Asset 5.png").convert_alpha()
-btn_hard   = pygame.image.load("assets/buttons/Asset 5.png").convert_alpha()
-
-# optional hover versions (if you want)
-btn_easy_h   = btn_3
-btn_medium_h = btn_3
-btn_hard_h   = btn_3
+ASSET_SPECS.update({
+    "store_popup_img": {"path": "assets/buttons/menubg.png", "size": (420, 420)},
+
+    "btn_easy":   {"source": "btn_1"},
+    "btn_medium": {"source": "btn_1"},
+    "btn_hard":   {"source": "btn_1"},
+
+    # optional hover versions (if you want)
+    "btn_easy_h":   {"source": "btn_3"},
+    "btn_medium_h": {"source": "btn_3"},
+    "btn_hard_h":   {"source": "btn_3"},
+})
 DIFF_BTN_TEXT_OFFSET_X = -14
  
 def draw_difficulty_button(img, rect, title, desc):
-    visual = pygame.mask.from_surface(img).get_bounding_rects()[0]
+    optical_x, optical_y = get_visual_bounds(img)[1]
 
-    draw_x = rect.centerx - (visual.x + visual.width // 2)
-    draw_y = rect.centery - (visual.y + visual.height // 2)
+    draw_x = rect.centerx - optical_x
+    draw_y = rect.centery - optical_y
 
     screen.blit(img, (draw_x, draw_y))
 
 
-    title_main = menu_font.render(title, True, (255,255,255))
-    title_outline = menu_font.render(title, True, (0,0,0))
-    desc_txt = retro_small.render(desc, True, (235,235,235))
+    _, title_w, title_h = render_outlined(menu_font, title)
+    desc_txt, desc_w, desc_h = render_outlined(retro_small, desc, (235,235,235), outline=0)
 
     spacing = 6
-    block_h = title_main.get_height() + spacing + desc_txt.get_height()
+    block_h = title_h + spacing + desc_h
     start_y = rect.centery - block_h // 2
 
     # 🔥 OPTICAL CENTER FIX HERE
     cx = rect.centerx + DIFF_BTN_TEXT_OFFSET_X
 
     # TITLE
-    tx = cx - title_main.get_width() // 2
+    tx = cx - title_w // 2
     ty = start_y
-    for ox, oy in [(-2,0),(2,0),(0,-2),(0,2)]:
-        screen.blit(title_outline, (tx+ox, ty+oy))
-    screen.blit(title_main, (tx, ty))
+    draw_outlined_text(menu_font, title, tx, ty)
 
     # DESCRIPTION
-    dx = cx - desc_txt.get_width() // 2
-    dy = ty + title_main.get_height() + spacing
+    dx = cx - desc_w // 2
+    dy = ty + title_h + spacing
     screen.blit(desc_txt, (dx, dy))
 
 
@@ -695,17 +1218,6 @@ def update_free_gate():
             passed_free_gate[d] = True
 
 
-BG = {
-    k: pygame.transform.smoothscale(v, (ROOM_DRAW, ROOM_DRAW))
-    for k, v in BG_RAW.items()
-}
-
-for key in card_images:
-    card_images[key] = pygame.transform.smoothscale(
-        card_images[key],
-        (CARD_WIDTH, CARD_HEIGHT)
-    )
-
 # =========================
 # GAME BOX (UNCHANGED LOGIC)
 # =========================
@@ -755,7 +1267,7 @@ DOORS = {
 WALL_THICK = 32
 
 CARDS_TITLE_Y = 10
-CARDS_TITLE_H = int(btn_1.get_height() * 0.50) + 6
+CARDS_TITLE_H = int(get_asset("btn_1").get_height() * 0.50) + 6
 
 show_gate_popup = False
 SIDEBAR_HUD_Y = 20
@@ -785,8 +1297,7 @@ WALLS = {
     ),
 }
 
-close_btn_img = pygame.image.load("assets/buttons/Asset 10.png").convert_alpha()
-close_btn_img = pygame.transform.smoothscale(close_btn_img, (32, 32))
+ASSET_SPECS["close_btn_img"] = {"path": "assets/buttons/Asset 10.png", "size": (32, 32)}
 STORE_CLOSE_BTN_RECT = pygame.Rect(0, 0, 32, 32)
 
 WALK_RECT = ROOM_RECT.copy()
@@ -796,110 +1307,105 @@ for r in DOORS.values():
 SPAWN = ROOM_RECT.center
 
 # =========================
-# WORLD (10x10 FIXED)
+# ROOM VIEW CACHE
 # =========================
-rooms = {}
-
-def room_id(x, y):
-    return y * GRID_W + x
-
-def create_world():
-    for y in range(GRID_H):
-        for x in range(GRID_W):
-            rid = room_id(x, y)
-            links = {}
-            if y > 0: links["top"] = room_id(x, y - 1)
-            if y < GRID_H - 1: links["bottom"] = room_id(x, y + 1)
-            if x > 0: links["left"] = room_id(x - 1, y)
-            if x < GRID_W - 1: links["right"] = room_id(x + 1, y)
-
-            rooms[rid] = {
-                "id": rid,
-                "pos": (x, y),
-                "type": random.choice(ROOM_TYPES),
-                "links": links,
-                "open_gates": {d: False for d in links}   # 👈 ADD THIS
-            }
+# The world area (static frame + centre room + neighbour strips) composed
+# once per room, so drawing the current room is a single blit.
+ROOM_VIEW_CACHE_SIZE = 8
+room_view_cache = OrderedDict()   # room_id → composed world-area surface
 
-def try_store_swap():
-    global store_uses_left
-    global cards
-    global store_selected_indices
-    global store_target_type
-    global gate_message, gate_message_timer
 
-    # ===== USE LIMIT =====
-    if store_uses_left <= 0:
-        gate_message = "STORE EMPTY!"
-        gate_message_timer = 90
-        return False
+def compose_room_view(rid):
+    view_w = SCREEN_WIDTH - SIDEBAR_W
+    view = pygame.Surface((view_w, SCREEN_HEIGHT)).convert()
+    view.blit(get_static_frame(), (0, 0), (SIDEBAR_W, 0, view_w, SCREEN_HEIGHT))
 
-    # ===== EXACTLY 2 CARDS =====
-    if len(store_selected_indices) != 2:
-        gate_message = "SELECT 2 CARDS!"
-        gate_message_timer = 90
-        return False
+    room = game.rooms[rid]
+    cx, cy = ROOM_RECT.x - SIDEBAR_W, ROOM_RECT.y
+    w = h = ROOM_DRAW
+    half = w // 2
 
-    i1, i2 = list(store_selected_indices)
-    c1 = cards[i1]
-    c2 = cards[i2]
+    # Center
+    view.blit(get_asset(ROOM_BG[room["type"]]), (cx, cy))
 
-    # ===== SAME TYPE REQUIRED =====
-    if c1["type"] != c2["type"]:
-        gate_message = "CARDS MUST BE SAME TYPE!"
-        gate_message_timer = 90
-        return False
+    # Neighbors (VISIBLE, NOT CLIPPED)
+    if "top" in room["links"]:
+        t = game.rooms[room["links"]["top"]]
+        view.blit(get_asset(ROOM_BG[t["type"]]), (cx, cy-half), (0, half, w, half))
+    if "bottom" in room["links"]:
+        b = game.rooms[room["links"]["bottom"]]
+        view.blit(get_asset(ROOM_BG[b["type"]]), (cx, cy+w), (0, 0, w, half))
+    if "left" in room["links"]:
+        l = game.rooms[room["links"]["left"]]
+        view.blit(get_asset(ROOM_BG[l["type"]]), (cx-half, cy), (half, 0, half, h))
+    if "right" in room["links"]:
+        r = game.rooms[room["links"]["right"]]
+        view.blit(get_asset(ROOM_BG[r["type"]]), (cx+w, cy), (0, 0, half, h))
 
-    # ===== TARGET TYPE REQUIRED =====
-    if store_target_type is None:
-        gate_message = "CHOOSE TARGET TYPE!"
-        gate_message_timer = 90
-        return False
+    return view
+
+
+def get_room_view(rid):
+    view = room_view_cache.get(rid)
+    if view is None:
+        view = compose_room_view(rid)
+        room_view_cache[rid] = view
+        if len(room_view_cache) > ROOM_VIEW_CACHE_SIZE:
+            room_view_cache.popitem(last=False)   # least recently used
+    else:
+        room_view_cache.move_to_end(rid)
+    return view
 
-    # ===== POWER SUM (CAPPED) =====
-    new_power = c1["power"] + c2["power"]
-    if new_power > CARD_MAX_POWER:
-        new_power = CARD_MAX_POWER
 
-    # ===== REMOVE OLD CARDS =====
-    for i in sorted(store_selected_indices, reverse=True):
-        cards.pop(i)
+# =========================
+# WORLD (10x10 FIXED)
+# =========================
+def try_store_swap():
+    global store_selected_indices
+    global store_target_type
+    global gate_message, gate_message_timer
 
-    # ===== ADD NEW CARD =====
-    cards.append({
-        "type": store_target_type,
-        "power": new_power
-    })
+    ok = game.step(("trade", store_selected_indices, store_target_type))
+    gate_message = game.message
+    gate_message_timer = 90
+    if not ok:
+        return False
 
     # ===== RESET =====
     store_selected_indices.clear()
     store_target_type = None
-    store_uses_left -= 1
-    SFX_SWAP.play()
-
-    gate_message = f"TRADE SUCCESS! POWER {new_power}"
-    gate_message_timer = 90
+    play_sfx("sfx_swap")
     return True
 
 
-create_world()
+mark_startup("module_setup")
+# the whole rules state of a run (see engine.py)
+game = GameState(seed=RUN_SEED, grid_w=WORLD_W, grid_h=WORLD_H)
+
+
+def deal_run():
+    """New run, re-dealt until the solver proves it winnable (see solver.py)."""
+    if reset_winnable(game) is None:
+        print("[RESET] no run proven winnable (search cap reached or world too big), playing it unchecked")
+
+
+deal_run()   # the opening run goes through the same check as every reset
+mark_startup("create_world")
 def print_world_grid():
+    if game.grid_w > PRINT_GRID_MAX or game.grid_h > PRINT_GRID_MAX:
+        print(f"\n=== WORLD GRID: {game.grid_w} × {game.grid_h} rooms ===\n")
+        return
     print("\n=== WORLD GRID (row, col → room_id) ===")
-    for y in range(GRID_H):
+    for y in range(game.grid_h):
         row = []
-        for x in range(GRID_W):
-            rid = room_id(x, y)
+        for x in range(game.grid_w):
+            rid = game.room_id(x, y)
             row.append(f"{rid:02d}")
         print(f"Row {y}: " + "  ".join(row))
     print("=====================================\n")
 
 print_world_grid()
 
-current = get_random_room_id()
-visited_rooms.add(current)
-explored_rooms.add(current)
-
-START_ROOM = current 
 # =========================
 # PLAYER
 # =========================
@@ -907,18 +1413,6 @@ player = pygame.Rect(0, 0, 16, 16)
 player.center = SPAWN
 
 
-# Generate finish room with minimum distance from start
-finish_room = get_random_room_id()
-while True:
-    start_x, start_y = rooms[current]["pos"]
-    end_x, end_y = rooms[finish_room]["pos"]
-    # Calculate Manhattan distance (total rooms to travel)
-    distance = abs(end_x - start_x) + abs(end_y - start_y)
-    # Require minimum distance of 6 rooms
-    if distance >= 6:
-        break
-    finish_room = get_random_room_id()
-
 # =========================
 # CARDS
 # =========================
@@ -952,7 +1446,7 @@ def move(dx, dy):
             if dy < 0: player.top = w.bottom
 
     for d, g in LOCKED_GATES.items():
-        if rooms[current]["open_gates"].get(d, False):
+        if game.rooms[game.current]["open_gates"].get(d, False):
             continue
 
         if not passed_free_gate[d]:
@@ -969,7 +1463,7 @@ def can_interact_gate():
         return None
 
     # gate already permanently open → no interaction
-    if rooms[current]["open_gates"].get(d, False):
+    if game.rooms[game.current]["open_gates"].get(d, False):
         return None
 
     return d
@@ -978,107 +1472,60 @@ def can_interact_gate():
 
 def try_swap_with_gate(d, selected_indices):
     global selected_reward_index
-    global cards
-
-    required_type = get_next_room_type(d)
-    gate_card = get_or_create_gate_card(current, d)
-    required_power = gate_card["power"]
-
-    chosen = [cards[i] for i in selected_indices]
-
-    # TYPE CHECK
-    if any(c["type"] != required_type for c in chosen):
-        global gate_message, gate_message_timer
-        gate_message = "WRONG CARD TYPE!"
-        gate_message_timer = 90
-        return False
-
-    # POWER SUM CHECK
-    if sum(c["power"] for c in chosen) < required_power:
-        gate_message = "NOT ENOUGH POWER!"
-        gate_message_timer = 90
-        return False
-
-    # REMOVE GIVEN CARDS
-    for i in sorted(selected_indices, reverse=True):
-        cards.pop(i)
-
-    # ADD REWARD CARD
-    # MUST SELECT A REWARD
+    global gate_message, gate_message_timer
+    global last_printed_room
 
-    if selected_reward_index is None:
-        gate_message = "CHOOSE A REWARD!"
-        gate_message_timer = 90
+    ok = game.step(("open_gate", d, selected_indices, selected_reward_index))
+    gate_message = game.message
+    gate_message_timer = 90
+    if not ok:
         return False
 
-    reward = gate_card["rewards"][selected_reward_index]
-    cards.append(reward)
     selected_reward_index = None
+    play_sfx("sfx_gate_open")
+    enter_room()
 
-
-    cur = current
-    nxt = rooms[current]["links"][d]
-
-    # open gate both sides
-    rooms[cur]["open_gates"][d] = True
-    SFX_GATE_OPEN.play()
-
-    opposite = {"top":"bottom", "bottom":"top", "left":"right", "right":"left"}
-    rooms[nxt]["open_gates"][opposite[d]] = True
-
-    change_room(d)
-    
-    
-    global last_printed_room
-
-    if current != last_printed_room:
+    if game.current != last_printed_room:
         print(f"[ROOM CHANGE]")
-        print(f"START ROOM : {START_ROOM}")
-        print(f"END ROOM   : {finish_room}")
-        print(f"CURRENT    : {current}")
+        print(f"START ROOM : {game.start_room}")
+        print(f"END ROOM   : {game.finish_room}")
+        print(f"CURRENT    : {game.current}")
         print("-" * 30)
-        last_printed_room = current
+        last_printed_room = game.current
     check_finish()
-    gate_message = "GATE OPENED!"
-    gate_message_timer = 90
-    selected_reward_index = None
     return True
 def draw_button_with_text(img, rect, text):
     # draw image
     screen.blit(img, rect.topleft)
 
-    text_main = menu_font.render(text, True, (255, 255, 255))
-    text_outline = menu_font.render(text, True, (0, 0, 0))
-
-    tx = rect.x + (rect.width  - text_main.get_width())  // 2
-    ty = rect.y + (rect.height - text_main.get_height()) // 2 - 3  # small lift
+    _, text_w, text_h = render_outlined(menu_font, text)
 
-    for ox, oy in [(-2,0),(2,0),(0,-2),(0,2)]:
-        screen.blit(text_outline, (tx+ox, ty+oy))
+    tx = rect.x + (rect.width  - text_w)  // 2
+    ty = rect.y + (rect.height - text_h) // 2 - 3  # small lift
 
-    screen.blit(text_main, (tx, ty))
+    draw_outlined_text(menu_font, text, tx, ty)
 
 
 def draw_points():
-    txt = retro_font.render(f"POINTS: {points}", True, (255, 255, 255))
+    txt = retro_font.render(f"POINTS: {game.points}", True, (255, 255, 255))
     screen.blit(txt, (SIDEBAR_W + 20, 10))
 
 def draw_start_end_rooms():
     y_base = 40  # below POINTS
 
     start_txt = retro_small.render(
-        f"START ROOM: #{START_ROOM}", True, (180, 180, 180)
+        f"START ROOM: #{game.start_room}", True, (180, 180, 180)
     )
     end_txt = retro_small.render(
-        f"END ROOM: #{finish_room}", True, (255, 120, 120)
+        f"END ROOM: #{game.finish_room}", True, (255, 120, 120)
     )
 
     screen.blit(start_txt, (SIDEBAR_W + 20, y_base))
     screen.blit(end_txt, (SIDEBAR_W + 20, y_base + 20))
 
 
-TRADE_BTN_RECT = pygame.Rect(0, 0, btn_1.get_width(), btn_1.get_height())
-STORE_TRADE_BTN_RECT = pygame.Rect(0, 0, btn_1.get_width(), btn_1.get_height())
+TRADE_BTN_RECT = pygame.Rect((0, 0), get_asset("btn_1").get_size())
+STORE_TRADE_BTN_RECT = pygame.Rect((0, 0), get_asset("btn_1").get_size())
 BACK_TO_MENU_BTN_RECT = pygame.Rect(0, 0, 50, 50)
 STORE_CARD_RECTS = []
 STORE_TYPE_RECTS = []
@@ -1109,6 +1556,7 @@ def handle_events(cards_start_y):
     global show_gate_popup
     global show_menu_confirmation
     global game_state
+    global show_hints
 
     pressed_e = False
 
@@ -1126,6 +1574,15 @@ def handle_events(cards_start_y):
             pygame.quit()
             sys.exit()
 
+        note_window_event(e)
+
+        # input can change anything on screen → next frame is a full update
+        if e.type in (pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN, pygame.WINDOWEXPOSED):
+            request_full_redraw()
+
+        if e.type == pygame.VIDEORESIZE:
+            invalidate_static_layers()
+
         # ===============================
         # KEYBOARD
         # ===============================
@@ -1133,6 +1590,9 @@ def handle_events(cards_start_y):
             if e.key == pygame.K_e:
                 pressed_e = True
 
+            if e.key == pygame.K_h:
+                show_hints = not show_hints
+
             if e.key == pygame.K_ESCAPE:
                 # Close menu confirmation if open
                 if show_menu_confirmation:
@@ -1204,7 +1664,7 @@ def handle_events(cards_start_y):
             if popup_rect.collidepoint(mx, my):
                 d = can_interact_gate()
                 if d:
-                    gate_card = get_or_create_gate_card(current, d)
+                    gate_card = game.gate_card(game.current, d)
                     rewards = gate_card["rewards"]
 
                     # 🔥 SINGLE SOURCE OF TRUTH
@@ -1217,7 +1677,7 @@ def handle_events(cards_start_y):
                     for i, rx in enumerate(reward_positions):
                         if pygame.Rect(rx, cards_y, CARD_WIDTH, CARD_HEIGHT).collidepoint(mx, my):
                             selected_reward_index = i
-                            SFX_CARD_SELECT.play()
+                            play_sfx("sfx_card_select")
                             return
                 return
 
@@ -1248,7 +1708,7 @@ def handle_events(cards_start_y):
                             store_selected_indices.remove(i)
                         elif len(store_selected_indices) < 2:
                             store_selected_indices.add(i)
-                            SFX_CARD_SELECT.play()
+                            play_sfx("sfx_card_select")
                         return
 
             if e.button == 1:
@@ -1267,7 +1727,7 @@ def handle_events(cards_start_y):
         # LEFT SIDEBAR CARD SELECTION
         # ==================================================
         if e.button == 1:
-            for i, c in enumerate(cards):
+            for i, c in enumerate(game.cards):
                 row = i // cards_per_row
                 col = i % cards_per_row
 
@@ -1279,7 +1739,7 @@ def handle_events(cards_start_y):
                         selected_card_indices.remove(i)
                     else:
                         selected_card_indices.add(i)
-                        SFX_CARD_SELECT.play()
+                        play_sfx("sfx_card_select")
                     return
 
 howto_scroll = 0  # global
@@ -1318,59 +1778,49 @@ def render_howto_line(line):
         return retro_small.render(line, True, (190, 190, 190))
 
 
-def change_room(direction):
-    global current, passed_free_gate
-
-    # mark neighbors as explored
-    for nxt in rooms[current]["links"].values():
-        explored_rooms.add(nxt)
-
-    if direction in rooms[current]["links"]:
-        current = rooms[current]["links"][direction]
-        visited_rooms.add(current)
-        explored_rooms.add(current)
+def enter_room():
+    """Player side of a room change (the engine already moved game.current)."""
+    global passed_free_gate
 
-        player.center = SPAWN
-        passed_free_gate = {k: False for k in passed_free_gate}
-        
-        # Check if player reached the goal
-        check_finish()
+    player.center = SPAWN
+    passed_free_gate = {k: False for k in passed_free_gate}
 
 def draw_back_to_menu_button():
     """Draw back-to-menu button using CLOSE icon as background"""
     # Top-right corner
-    BACK_TO_MENU_BTN_RECT.size = close_btn_img.get_size()
+    BACK_TO_MENU_BTN_RECT.size = get_asset("close_btn_img").get_size()
     BACK_TO_MENU_BTN_RECT.x = SCREEN_WIDTH - BACK_TO_MENU_BTN_RECT.width - 20
     BACK_TO_MENU_BTN_RECT.y = 20
 
     mx, my = pygame.mouse.get_pos()
     hover = BACK_TO_MENU_BTN_RECT.collidepoint(mx, my)
 
+    mark_dirty(BACK_TO_MENU_BTN_RECT.inflate(6, 6))
+
     # Slight hover glow
-    if hover:
-        glow = pygame.Surface(
+    if hover and not shed_optional:
+        glow = get_fill_surface(
             (BACK_TO_MENU_BTN_RECT.width + 6, BACK_TO_MENU_BTN_RECT.height + 6),
-            pygame.SRCALPHA
+            (255, 255, 255, 40)
         )
-        glow.fill((255, 255, 255, 40))
         screen.blit(glow, (BACK_TO_MENU_BTN_RECT.x - 3, BACK_TO_MENU_BTN_RECT.y - 3))
 
     # Draw close button image
-    screen.blit(close_btn_img, BACK_TO_MENU_BTN_RECT.topleft)
+    draw_ui("close_btn_img", BACK_TO_MENU_BTN_RECT.topleft)
 def draw_menu_confirmation_dialog():
     global MENU_CONFIRM_YES_RECT, MENU_CONFIRM_NO_RECT
 
     # ---- overlay ----
-    overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-    overlay.fill((0, 0, 0, 180))
+    overlay = get_fill_surface((SCREEN_WIDTH, SCREEN_HEIGHT), (0, 0, 0, 180))
     screen.blit(overlay, (0, 0))
 
     # ---- dialog ----
-    dialog_w, dialog_h = menu_confirm_bg.get_size()
+    dialog_w, dialog_h = get_asset("menu_confirm_bg").get_size()
     dialog_x = SCREEN_WIDTH // 2 - dialog_w // 2
     dialog_y = SCREEN_HEIGHT // 2 - dialog_h // 2
 
-    screen.blit(menu_confirm_bg, (dialog_x, dialog_y))
+    draw_ui("menu_confirm_bg", (dialog_x, dialog_y))
+    mark_dirty((dialog_x, dialog_y, dialog_w, dialog_h))
 
     # ---- text ----
     title = retro_font.render("RETURN TO MENU?", True, (255, 200, 80))
@@ -1381,7 +1831,7 @@ def draw_menu_confirmation_dialog():
 
     # ---- buttons (OPTICAL CENTER) ----
     # NEW (match rect to image size)
-    button_w, button_h = btn_1.get_size()
+    button_w, button_h = get_asset("btn_1").get_size()
 
     button_gap = 30
     button_y = dialog_y + dialog_h - 62
@@ -1411,54 +1861,23 @@ def draw_menu_confirmation_dialog():
 
 
 def can_use_card_for_gate(card, d):
-    if d is None:
-        return False
-
-    required_type = get_next_room_type(d)
-    gate_card = get_or_create_gate_card(current, d)
-    required_power = gate_card["power"]
-
-    if card["type"] != required_type:
-        return False
-
-    # total power of ALL SAME-TYPE cards (including this one)
-    total = sum(
-        c["power"] for c in cards
-        if c["type"] == required_type
-    )
-
     # glow ONLY if reaching the requirement is possible
-    return total >= required_power
+    return game.can_use_card(card, d)
 
 
 
 def handle_doors():
-    global current
-
     for d, r in DOORS.items():
-        if not rooms[current]["open_gates"].get(d, False):
+        if not game.gate_open(d):
             continue
 
         if player.colliderect(r):
-            prev = current
-            current = rooms[current]["links"].get(d, current)
+            game.step(("walk", d))
             player.center = SPAWN
 
             # clear transient states ONLY
             for k in passed_free_gate:
                 passed_free_gate[k] = False
-
-            # ensure gate is open from BOTH sides
-            opposite = {
-                "top": "bottom",
-                "bottom": "top",
-                "left": "right",
-                "right": "left"
-            }[d]
-
-            rooms[current].setdefault("open_gates", {})
-            rooms[current]["open_gates"][opposite] = True
-
             break
 
 def draw_press_e_hint():
@@ -1467,33 +1886,31 @@ def draw_press_e_hint():
     if d is None:
         return
     txt = retro_small.render("Wanna Pass??", True, (255, 255, 255))
-    screen.blit(txt, (player.centerx - txt.get_width() // 2, player.top - 20))
+    pos = (player.centerx - txt.get_width() // 2, player.top - 20)
+    screen.blit(txt, pos)
+    mark_dirty((pos, txt.get_size()))
 
 
 # =========================
 # DRAW UI
 # =========================
 def draw_banner_title(text, center_x, y, scale=1):
-    bw, bh = btn_1.get_size()
+    bw, bh = get_asset("btn_1").get_size()
 
     sw = int(bw * scale)
     sh = int(bh * scale)
 
-    banner = pygame.transform.smoothscale(btn_1, (sw, sh))
+    banner = get_scaled(get_asset("btn_1"), (sw, sh))
     x = center_x - sw // 2
 
     screen.blit(banner, (x, y))
 
-    text_main = menu_font.render(text, True, (255, 255, 255))
-    text_outline = menu_font.render(text, True, (0, 0, 0))
-
-    tx = center_x - text_main.get_width() // 2
-    ty = y + sh // 2 - text_main.get_height() // 2 - 2
+    _, text_w, text_h = render_outlined(menu_font, text)
 
-    for ox, oy in [(-2,0),(2,0),(0,-2),(0,2)]:
-        screen.blit(text_outline, (tx + ox, ty + oy))
+    tx = center_x - text_w // 2
+    ty = y + sh // 2 - text_h // 2 - 2
 
-    screen.blit(text_main, (tx, ty))
+    draw_outlined_text(menu_font, text, tx, ty)
     return sh
 
 
@@ -1511,29 +1928,21 @@ def draw_cards(start_y):
     gap_y = CARD_HEIGHT - CARDS_ROW_OVERLAP
     cards_per_row = CARDS_PER_ROW
 
+    gate_dir = can_interact_gate()
 
-    for i, c in enumerate(cards):
-        key = CARD_IMAGE_KEY[c["type"]]
-
+    for i, c in enumerate(game.cards):
         row = i // cards_per_row
         col = i % cards_per_row
 
         x = start_x + col * (CARD_WIDTH + gap_x)
         y = start_y + row * gap_y
         if row > 0:
-            shadow = pygame.Surface((CARD_WIDTH, 20), pygame.SRCALPHA)
-            shadow.fill((0, 0, 0, 60))
+            shadow = get_fill_surface((CARD_WIDTH, 20), (0, 0, 0, 60))
             screen.blit(shadow, (x, y))
 
-        # card image
-        screen.blit(card_images[key], (x, y))
-
-        # GLOW IF CARD CAN BE USED FOR CURRENT GATE
-        d = can_interact_gate()
-        if d and can_use_card_for_gate(c, d):
-            glow = pygame.Surface((CARD_WIDTH, CARD_HEIGHT), pygame.SRCALPHA)
-            glow.fill((255, 255, 255, 50))
-            screen.blit(glow, (x, y))
+        # card face (GLOW IF CARD CAN BE USED FOR CURRENT GATE)
+        usable = gate_dir is not None and can_use_card_for_gate(c, gate_dir)
+        draw_card_face(c["type"], c["power"], x, y, glow=usable and not shed_optional)
 
 
         # border
@@ -1564,27 +1973,6 @@ def draw_cards(start_y):
             )
 
 
-
-        # BIG POWER IN CENTER
-        power_str = str(c["power"])
-
-        # outline (black border)
-        power_outline = retro_power.render(power_str, True, (0, 0, 0))
-        power_text    = retro_power.render(power_str, True, (255, 255, 255))
-
-        px = x + CARD_WIDTH // 2 - power_text.get_width() // 2
-        py = y + CARD_HEIGHT // 2 - power_text.get_height() // 2
-
-        # draw outline (4 directions)
-        screen.blit(power_outline, (px - 2, py))
-        screen.blit(power_outline, (px + 2, py))
-        screen.blit(power_outline, (px, py - 2))
-        screen.blit(power_outline, (px, py + 2))
-
-        # draw main text
-        screen.blit(power_text, (px, py))
-
-
 # CARDS_START_Y = draw_cards_title() + 12
 
 def get_free_gate_dir():
@@ -1594,10 +1982,8 @@ def get_free_gate_dir():
     return None
 
 def draw_full_card(card, x, y):
-    key = CARD_IMAGE_KEY[card["type"]]
-
-    # image
-    screen.blit(card_images[key], (x, y))
+    # image + power, baked
+    draw_card_face(card["type"], card["power"], x, y)
 
     # border
     # pygame.draw.rect(
@@ -1608,13 +1994,11 @@ def draw_full_card(card, x, y):
     #     border_radius=8
     # )
 
-    draw_card_power(x, y, card["power"])
-
 def draw_gate_message():
     if gate_message_timer <= 0 or not gate_message:
         return
 
-    bg_w, bg_h = msg_bg.get_size()
+    bg_w, bg_h = get_asset("msg_bg").get_size()
 
     # Position: bottom-center of room area
     cx = ROOM_RECT.centerx
@@ -1624,7 +2008,8 @@ def draw_gate_message():
     bg_y = y
 
     # Draw background
-    screen.blit(msg_bg, (bg_x, bg_y))
+    draw_ui("msg_bg", (bg_x, bg_y))
+    mark_dirty((bg_x, bg_y, bg_w, bg_h))
 
     # Draw text
     txt = retro_font.render(gate_message, True, (255, 220, 120))
@@ -1687,7 +2072,7 @@ def draw_store_ui(base_x, base_y):
     title_h = draw_banner_title("STORE", center_x, base_y + 20)
 
     # ---- USES LEFT ----
-    uses = retro_small.render(f"USES LEFT: {store_uses_left}", True, (200,200,200))
+    uses = retro_small.render(f"USES LEFT: {game.store_uses_left}", True, (200,200,200))
     screen.blit(uses, (center_x - uses.get_width()//2, base_y + 20 + title_h + 10))
 
     # ---- YOUR CARDS ----
@@ -1717,11 +2102,12 @@ def draw_store_ui(base_x, base_y):
                           rect.centery - txt.get_height()//2))
 
     # ---- TRADE BUTTON ----
+    btn_w, btn_h = get_asset("btn_1").get_size()
     btn_rect = pygame.Rect(
-        center_x - btn_1.get_width()//2,
+        center_x - btn_w//2,
         type_y + 45,
-        btn_1.get_width(),
-        btn_1.get_height()
+        btn_w,
+        btn_h
     )
 
     mx, my = pygame.mouse.get_pos()
@@ -1733,18 +2119,19 @@ def draw_store_ui(base_x, base_y):
 
 def draw_trade_button_center(cards_end_y):
     # CENTER INSIDE LEFT SIDEBAR
-    TRADE_BTN_RECT.x = SIDEBAR_W // 2 - btn_1.get_width() // 2
+    TRADE_BTN_RECT.x = SIDEBAR_W // 2 - get_asset("btn_1").get_width() // 2
     TRADE_BTN_RECT.y = cards_end_y + 40
 
     mx, my = pygame.mouse.get_pos()
     hover = TRADE_BTN_RECT.collidepoint(mx, my)
 
     draw_image_button(TRADE_BTN_RECT, "TRADE", hover)
+    mark_dirty(TRADE_BTN_RECT)
     return TRADE_BTN_RECT
 
 
 def draw_image_button(rect, text, hover=False):
-    img = btn_3 if hover else btn_1
+    img = get_asset("btn_3") if hover else get_asset("btn_1")
     draw_button_with_text(img, rect, text)
 
 def get_blocking_walls():
@@ -1771,105 +2158,177 @@ def get_blocking_walls():
 
 def draw_cursor():
     mx, my = pygame.mouse.get_pos()
-    screen.blit(
-        cursor_img,
-        (mx - cursor_img.get_width() // 2,
-         my - cursor_img.get_height() // 2)
+    cursor = get_asset("cursor_img")
+    draw_ui(
+        "cursor_img",
+        (mx - cursor.get_width() // 2,
+         my - cursor.get_height() // 2)
     )
     
 
 
 def get_next_room_type(d):
-    nxt = rooms[current]["links"].get(d)
-    if nxt is None:
-        return None
-    return rooms[nxt]["type"]
-def draw_minimap():
-    panel_size = MINIMAP_SIZE
-    panel_x = SCREEN_WIDTH - panel_size - 30
-    panel_y = SCREEN_HEIGHT - panel_size - 30
-    screen.blit(minimap_bg, (panel_x, panel_y))
-    center = (
-        panel_x + panel_size // 2,
-        panel_y + panel_size // 2
-    )
-    radius_px = panel_size // 2 - 2
+    return game.next_room_type(d)
+# =========================
+# MINIMAP
+# =========================
+# The minimap lives in an off-screen surface that is redrawn only when the
+# current room or the visited / explored sets change; every other frame it
+# is a single blit. Circle visibility is precomputed per radius.
+MINIMAP_NODE = 14
+MINIMAP_GAP = 4
+MINIMAP_STEP = MINIMAP_NODE + MINIMAP_GAP
+MINIMAP_RADIUS_PX = MINIMAP_SIZE // 2 - 2
+
+
+def build_minimap_cells(radius):
+    """(dx, dy, inside_circle) for every offset around the current room, in draw order."""
+    cells = []
+    for dy in range(-radius, radius + 1):
+        for dx in range(-radius, radius + 1):
+            inside_circle = (
+                (dx * MINIMAP_STEP)**2 + (dy * MINIMAP_STEP)**2 <= MINIMAP_RADIUS_PX**2
+            )
+            cells.append((dx, dy, inside_circle))
+    return cells
 
-    node = 14
-    gap = 4
-    step = node + gap
-    radius = difficulty_settings[current_difficulty]["minimap_radius"]
 
-    # background circle
-    # pygame.draw.circle(screen, (20, 20, 20), center, radius_px)
-    # pygame.draw.circle(screen, (180, 180, 180), center, radius_px, 2)
+minimap_cells = {
+    settings["minimap_radius"]: build_minimap_cells(settings["minimap_radius"])
+    for settings in difficulty_settings.values()
+}
+minimap_surface = None
+minimap_key = None
 
-    cx0, cy0 = rooms[current]["pos"]
+# H toggles the cheapest route (see hints.py) drawn over the minimap
+hints = RouteHints(game)
+show_hints = False
+hint_path = None
+HINT_COLOR = (255, 220, 80)
 
-    center_x = panel_x + panel_size // 2 - node // 2
-    center_y = panel_y + panel_size // 2 - node // 2
 
-    for dy in range(-radius, radius + 1):
-        for dx in range(-radius, radius + 1):
-            nx = cx0 + dx
-            ny = cy0 + dy
+def build_minimap_surface(radius, path=None):
+    node = MINIMAP_NODE
 
-            if nx < 0 or ny < 0 or nx >= GRID_W or ny >= GRID_H:
+    # cells near the window edge (and their outlines) reach past the panel
+    pad = max(0, radius * MINIMAP_STEP + node // 2 + 2 - MINIMAP_SIZE // 2)
+    surf = pygame.Surface(
+        (MINIMAP_SIZE + pad * 2, MINIMAP_SIZE + pad * 2),
+        pygame.SRCALPHA
+    )
+    surf.blit(get_asset("minimap_bg"), (pad, pad))
+
+    if radius not in minimap_cells:
+        minimap_cells[radius] = build_minimap_cells(radius)
+
+    cx0, cy0 = game.rooms[game.current]["pos"]
+
+    center_x = pad + MINIMAP_SIZE // 2 - node // 2
+    center_y = pad + MINIMAP_SIZE // 2 - node // 2
+
+    # hint route under the cells, clipped to the part of the minimap that is drawn
+    if path:
+        visible = {
+            (dx, dy) for dx, dy, inside_circle in minimap_cells[radius] if inside_circle
+        }
+        for a, b in zip(path, path[1:]):
+            (ax, ay), (bx, by) = game.rooms[a]["pos"], game.rooms[b]["pos"]
+            if (ax - cx0, ay - cy0) not in visible or (bx - cx0, by - cy0) not in visible:
                 continue
+            pygame.draw.line(
+                surf,
+                HINT_COLOR,
+                (center_x + (ax - cx0) * MINIMAP_STEP + node // 2,
+                 center_y + (ay - cy0) * MINIMAP_STEP + node // 2),
+                (center_x + (bx - cx0) * MINIMAP_STEP + node // 2,
+                 center_y + (by - cy0) * MINIMAP_STEP + node // 2),
+                3
+            )
+
+    for dx, dy, inside_circle in minimap_cells[radius]:
+        nx = cx0 + dx
+        ny = cy0 + dy
 
-            rid = room_id(nx, ny)
+        if nx < 0 or ny < 0 or nx >= game.grid_w or ny >= game.grid_h:
+            continue
 
-            x = center_x + dx * step
-            y = center_y + dy * step
+        rid = game.room_id(nx, ny)
 
-            rx = x + node // 2
-            ry = y + node // 2
+        x = center_x + dx * MINIMAP_STEP
+        y = center_y + dy * MINIMAP_STEP
 
-            inside_circle = (rx - center[0])**2 + (ry - center[1])**2 <= radius_px**2
+        # ==================================================
+        # 1️⃣ Draw GOAL OUTLINE only if explored or inside circle
+        # ==================================================
+        if rid == game.finish_room and (rid in game.explored_rooms or inside_circle):
+            pygame.draw.rect(
+                surf,
+                (255, 80, 80),
+                (x - 2, y - 2, node + 4, node + 4),
+                2,
+                border_radius=3
+            )
 
-            # ==================================================
-            # 1️⃣ Draw GOAL OUTLINE only if explored or inside circle
-            # ==================================================
-            if rid == finish_room and (rid in explored_rooms or inside_circle):
-                pygame.draw.rect(
-                    screen,
-                    (255, 80, 80),
-                    (x - 2, y - 2, node + 4, node + 4),
-                    2,
-                    border_radius=3
-                )
+        # ==================================================
+        # 2️⃣ Draw filled cells ONLY if inside circle
+        # ==================================================
+        if not inside_circle:
+            continue
 
-            # ==================================================
-            # 2️⃣ Draw filled cells ONLY if inside circle
-            # ==================================================
-            if not inside_circle:
-                continue
+        # decide fill color
+        if rid == game.current:
+            color = (255, 255, 255)
+        elif rid == game.finish_room:
+            color = (255, 80, 80)
+        elif rid in game.visited_rooms:
+            color = (245, 245, 245)
+        elif rid in game.explored_rooms:
+            color = ROOM_COLORS[game.rooms[rid]["type"]]
+        else:
+            continue  # unknown stays hidden
 
-            # decide fill color
-            if rid == current:
-                color = (255, 255, 255)
-            elif rid == finish_room:
-                color = (255, 80, 80)
-            elif rid in visited_rooms:
-                color = (245, 245, 245)
-            elif rid in explored_rooms:
-                color = ROOM_COLORS[rooms[rid]["type"]]
-            else:
-                continue  # unknown stays hidden
-
-            pygame.draw.rect(screen, color, (x, y, node, node))
-
-            # ==================================================
-            # 3️⃣ CURRENT ROOM GLOW
-            # ==================================================
-            if rid == current:
-                pygame.draw.rect(
-                    screen,
-                    (255, 255, 120),
-                    (x - 2, y - 2, node + 4, node + 4),
-                    2,
-                    border_radius=3
-                )
+        pygame.draw.rect(surf, color, (x, y, node, node))
+
+        # ==================================================
+        # 3️⃣ CURRENT ROOM GLOW
+        # ==================================================
+        if rid == game.current:
+            pygame.draw.rect(
+                surf,
+                (255, 255, 120),
+                (x - 2, y - 2, node + 4, node + 4),
+                2,
+                border_radius=3
+            )
+
+    return surf
+
+
+def draw_minimap():
+    global minimap_surface, minimap_key, hint_path
+
+    panel_x = SCREEN_WIDTH - MINIMAP_SIZE - 30
+    panel_y = SCREEN_HEIGHT - MINIMAP_SIZE - 30
+    radius = difficulty_settings[current_difficulty]["minimap_radius"]
+
+    if show_hints:
+        path = hints.update()   # bounded work; keeps the old route while searching
+        if hints.done:
+            hint_path = path
+    path = hint_path if show_hints else None
+
+    key = (
+        game.current, len(game.visited_rooms), len(game.explored_rooms),
+        game.finish_room, radius, path and tuple(path)
+    )
+    if key != minimap_key:
+        minimap_surface = build_minimap_surface(radius, path)
+        minimap_key = key
+        mark_dirty(minimap_surface.get_rect(center=(panel_x + MINIMAP_SIZE // 2,
+                                                    panel_y + MINIMAP_SIZE // 2)))
+
+    pad = (minimap_surface.get_width() - MINIMAP_SIZE) // 2
+    screen.blit(minimap_surface, (panel_x - pad, panel_y - pad))
 
 
 def draw_card(screen, card_type, x, y):
@@ -1877,7 +2336,7 @@ def draw_card(screen, card_type, x, y):
 
 
 def draw_card_with_border(screen, card_type, x, y):
-    screen.blit(card_images[card_type], (x, y))
+    screen.blit(get_asset("card_" + card_type), (x, y))
     pygame.draw.rect(
         screen,
         (220, 220, 220),  # light border
@@ -1887,10 +2346,11 @@ def draw_card_with_border(screen, card_type, x, y):
     
     
 def draw_main_menu():
-    screen.blit(menu_bg, (0, 0))
+    screen.blit(get_asset("menu_bg"), (0, 0))
     mx, my = pygame.mouse.get_pos()
 
     # ---- LOGO ----
+    logo_img = get_asset("logo_img")
     logo_x = SCREEN_WIDTH // 2 - logo_img.get_width() // 2
     logo_y = LOGO_TOP_Y
     screen.blit(logo_img, (logo_x, logo_y))
@@ -1904,13 +2364,13 @@ def draw_main_menu():
     menu_buttons["quit"].y  = buttons_start_y + btn_gap * 2
 
     # ---- DRAW BUTTONS ----
-    img = btn_3 if menu_buttons["start"].collidepoint(mx, my) else btn_1
+    img = get_asset("btn_3") if menu_buttons["start"].collidepoint(mx, my) else get_asset("btn_1")
     draw_button_with_text(img, menu_buttons["start"], "START GAME")
 
-    img = btn_3 if menu_buttons["howto"].collidepoint(mx, my) else btn_1
+    img = get_asset("btn_3") if menu_buttons["howto"].collidepoint(mx, my) else get_asset("btn_1")
     draw_button_with_text(img, menu_buttons["howto"], "HOW TO PLAY")
 
-    img = btn_3 if menu_buttons["quit"].collidepoint(mx, my) else btn_1
+    img = get_asset("btn_3") if menu_buttons["quit"].collidepoint(mx, my) else get_asset("btn_1")
     draw_button_with_text(img, menu_buttons["quit"], "QUIT")
 
 
@@ -1918,24 +2378,17 @@ def draw_main_menu():
 def draw_card_power(x, y, power):
     text = str(power)
 
-    outline = retro_power.render(text, True, (0, 0, 0))
-    main    = retro_power.render(text, True, (255, 255, 255))
+    _, text_w, text_h = render_outlined(retro_power, text)
 
     cx = x + CARD_WIDTH // 2
     cy = y + CARD_HEIGHT // 2
 
-    for ox, oy in [(-2,0),(2,0),(0,-2),(0,2)]:
-        screen.blit(outline, (cx - outline.get_width()//2 + ox,
-                               cy - outline.get_height()//2 + oy))
-
-    screen.blit(main, (cx - main.get_width()//2,
-                       cy - main.get_height()//2))
+    draw_outlined_text(retro_power, text, cx - text_w//2, cy - text_h//2)
 
 
 def draw_selected_card(screen, card_type, x, y):
-    screen.blit(card_images[card_type], (x, y))
-    glow_rect = pygame.Surface((CARD_WIDTH, CARD_HEIGHT), pygame.SRCALPHA)
-    glow_rect.fill((255, 255, 255, 40))  # soft white glow
+    screen.blit(get_asset("card_" + card_type), (x, y))
+    glow_rect = get_fill_surface((CARD_WIDTH, CARD_HEIGHT), (255, 255, 255, 40))  # soft white glow
     screen.blit(glow_rect, (x, y))
     
     
@@ -1964,33 +2417,28 @@ def draw_howto():
         y += 28
         
 def draw_hud_line(text, cx, y, font, color=(255,255,255)):
-    outline = font.render(text, True, (0,0,0))
-    main    = font.render(text, True, color)
-
-    x = cx - main.get_width() // 2
+    _, text_w, _ = render_outlined(font, text, color, outline=1)
 
-    for ox, oy in [(-1,0),(1,0),(0,-1),(0,1)]:
-        screen.blit(outline, (x + ox, y + oy))
+    x = cx - text_w // 2
 
-    screen.blit(main, (x, y))
+    draw_outlined_text(font, text, x, y, color, outline=1)
 
 def draw_game_hud():
     cx = HUD_X + HUD_W // 2
 
     # ---- shadow ----
-    shadow = pygame.Surface((HUD_W, HUD_H), pygame.SRCALPHA)
-    shadow.fill((0, 0, 0, 90))
+    shadow = get_fill_surface((HUD_W, HUD_H), (0, 0, 0, 90))
     screen.blit(shadow, (HUD_X + 4, HUD_Y + 4))
 
     # ---- background ----
-    screen.blit(hud_bg, (HUD_X, HUD_Y))
+    draw_ui("hud_bg", (HUD_X, HUD_Y))
 
     y0 = HUD_Y + 26
     gap = 26
 
     # LINE 1 — POINTS (BIGGER)
     draw_hud_line(
-        f"POINTS: {points}",
+        f"POINTS: {game.points}",
         cx,
         y0,
         HUD_FONT_BIG
@@ -1998,7 +2446,7 @@ def draw_game_hud():
 
     # LINE 2 — START
     draw_hud_line(
-        f"START ROOM: #{START_ROOM}",
+        f"START ROOM: #{game.start_room}",
         cx,
         y0 + gap + 6,
         HUD_FONT_NORMAL
@@ -2006,7 +2454,7 @@ def draw_game_hud():
 
     # LINE 3 — END
     draw_hud_line(
-        f"END ROOM: #{finish_room}",
+        f"END ROOM: #{game.finish_room}",
         cx,
         y0 + gap * 2 + 6,
         HUD_FONT_NORMAL,
@@ -2015,23 +2463,23 @@ def draw_game_hud():
 
     # LINE 4 — CURRENT ROOM
     draw_hud_line(
-        f"{rooms[current]['type'].upper()} CHAMBER  -  #{current}",
+        f"{game.rooms[game.current]['type'].upper()} CHAMBER  -  #{game.current}",
         cx,
         y0 + gap * 3 + 6,
         HUD_FONT_NORMAL
     )
 
 
-def handle_menu_events():
+def handle_menu_events(events):
     global game_state
 
-    for e in pygame.event.get():
+    for e in events:
         if e.type == pygame.QUIT:
             pygame.quit()
             sys.exit()
 
         if e.type == pygame.MOUSEBUTTONDOWN and e.button == 1:
-            SFX_CLICK.play()
+            play_sfx("sfx_click")
             mx, my = e.pos
 
             if menu_buttons["start"].collidepoint(mx, my):
@@ -2044,10 +2492,10 @@ def handle_menu_events():
                 pygame.quit()
                 sys.exit()
 
-def handle_howto_events():
+def handle_howto_events(events):
     global game_state, howto_scroll
 
-    for e in pygame.event.get():
+    for e in events:
         if e.type == pygame.QUIT:
             pygame.quit()
             sys.exit()
@@ -2067,10 +2515,10 @@ def handle_howto_events():
         if e.type == pygame.MOUSEWHEEL:
             howto_scroll -= e.y * 40
 
-def handle_difficulty_events():
-    global game_state, current_difficulty, MAX_POINTS, POINT_DECAY_PER_SEC, store_uses_left
+def handle_difficulty_events(events):
+    global game_state, current_difficulty
 
-    for e in pygame.event.get():
+    for e in events:
         if e.type == pygame.QUIT:
             pygame.quit()
             sys.exit()
@@ -2080,14 +2528,14 @@ def handle_difficulty_events():
             return
 
         if e.type == pygame.MOUSEBUTTONDOWN and e.button == 1:
-            SFX_CLICK.play()
+            play_sfx("sfx_click")
             mx, my = e.pos
 
             # Create button rects
             center_x = SCREEN_WIDTH // 2
             start_y = SCREEN_HEIGHT // 2 - 100
             button_gap = 80
-            button_w, button_h = btn_easy.get_size()
+            button_w, button_h = get_asset("btn_easy").get_size()
 
 
             easy_rect = pygame.Rect(center_x - button_w // 2, start_y, button_w, button_h)
@@ -2117,17 +2565,17 @@ def handle_difficulty_events():
 
 
 def apply_difficulty_settings():
-    global MAX_POINTS, POINT_DECAY_PER_SEC, store_uses_left, STORE_MAX_USES
-    
     settings = difficulty_settings[current_difficulty]
-    MAX_POINTS = settings["max_points"]
-    POINT_DECAY_PER_SEC = settings["point_decay"]
-    STORE_MAX_USES = settings["store_uses"]
-    store_uses_left = STORE_MAX_USES
+    game.configure(
+        settings["max_points"],
+        settings["point_decay"],
+        settings["store_uses"]
+    )
+    invalidate_static_layers()
 
 
 def draw_difficulty_screen():
-    screen.blit(menu_bg, (0, 0))
+    screen.blit(get_asset("menu_bg"), (0, 0))
     
     # Title
     title = retro_font.render("SELECT DIFFICULTY", True, (255, 255, 255))
@@ -2147,7 +2595,7 @@ def draw_difficulty_screen():
     hard_rect = pygame.Rect(center_x - button_w // 2, start_y + button_gap * 2, button_w, button_h)
     
     # Easy
-    easy_img = btn_easy_h if easy_rect.collidepoint(mx, my) else btn_easy
+    easy_img = get_asset("btn_easy_h") if easy_rect.collidepoint(mx, my) else get_asset("btn_easy")
     draw_difficulty_button(
         easy_img,
         easy_rect,
@@ -2156,7 +2604,7 @@ def draw_difficulty_screen():
     )
 
     # Medium
-    medium_img = btn_medium_h if medium_rect.collidepoint(mx, my) else btn_medium
+    medium_img = get_asset("btn_medium_h") if medium_rect.collidepoint(mx, my) else get_asset("btn_medium")
     draw_difficulty_button(
         medium_img,
         medium_rect,
@@ -2165,7 +2613,7 @@ def draw_difficulty_screen():
     )
 
     # Hard
-    hard_img = btn_hard_h if hard_rect.collidepoint(mx, my) else btn_hard
+    hard_img = get_asset("btn_hard_h") if hard_rect.collidepoint(mx, my) else get_asset("btn_hard")
     draw_difficulty_button(
         hard_img,
         hard_rect,
@@ -2179,10 +2627,10 @@ def draw_difficulty_screen():
     screen.blit(hint, (SCREEN_WIDTH // 2 - hint.get_width() // 2, SCREEN_HEIGHT - 80))
 
 
-def handle_howto_events():
+def handle_howto_events(events):
     global game_state
 
-    for e in pygame.event.get():
+    for e in events:
         if e.type == pygame.QUIT:
             pygame.quit()
             sys.exit()
@@ -2193,28 +2641,11 @@ def handle_howto_events():
 
 
 def reset_game():
-    global current, visited_rooms, explored_rooms
-    global cards, points, GAME_OVER, GAME_WIN, GAME_ENDED
-    global gate_cards
-
-    points = MAX_POINTS
-    GAME_OVER = False
-    GAME_WIN = False
-    GAME_ENDED = False
-
-    visited_rooms.clear()
-    explored_rooms.clear()
-    gate_cards.clear()  # Clear all gate cards for fresh start
-
-    cards.clear()
-    for _ in range(MAX_CARDS):
-        c = create_random_card()
-        c["power"] = random.randint(6, CARD_MAX_POWER)
-        cards.append(c)
+    global minimap_key, hint_path
 
-    current = get_random_room_id()
-    visited_rooms.add(current)
-    explored_rooms.add(current)
+    deal_run()
+    hint_path = None
+    minimap_key = None   # room sets were rebuilt from scratch
 
     player.center = SPAWN
 
@@ -2225,7 +2656,7 @@ def draw_gate_card_popup():
         return
 
     give_type = get_next_room_type(d)
-    gate_card = get_or_create_gate_card(current, d)
+    gate_card = game.gate_card(game.current, d)
     power = gate_card["power"]
     rewards = gate_card["rewards"]
 
@@ -2261,11 +2692,12 @@ def draw_swap_button():
     if not show_swap_ui or not selected_card_indices:
         return None
 
+    btn_w, btn_h = get_asset("btn_1").get_size()
     rect = pygame.Rect(
-        ROOM_RECT.centerx - btn_1.get_width() // 2,
+        ROOM_RECT.centerx - btn_w // 2,
         ROOM_RECT.centery + CARD_HEIGHT // 2 + 30,
-        btn_1.get_width(),
-        btn_1.get_height()
+        btn_w,
+        btn_h
     )
 
     mx, my = pygame.mouse.get_pos()
@@ -2275,10 +2707,7 @@ def draw_swap_button():
     return rect
 
 def check_finish():
-    global GAME_WIN, GAME_ENDED
-    if current == finish_room:
-        GAME_WIN = True
-        GAME_ENDED = True
+    if game.game_win:
         play_music(MUSIC_WIN, loop=False)
 
 
@@ -2288,12 +2717,12 @@ def draw_sidebar_hud():
     y = 18
 
     # soft shadow ONLY under parchment
-    shadow = pygame.Surface((SIDEBAR_HUD_W, SIDEBAR_HUD_H), pygame.SRCALPHA)
-    # shadow.fill((0, 100, 100, 70))
+    shadow = get_fill_surface((SIDEBAR_HUD_W, SIDEBAR_HUD_H), (0, 0, 0, 0))
+    # shadow = get_fill_surface((SIDEBAR_HUD_W, SIDEBAR_HUD_H), (0, 100, 100, 70))
     screen.blit(shadow, (x + 4, y + 4))
 
     # parchment background
-    screen.blit(hud_bg_sidebar, (x, y))
+    draw_ui("hud_bg_sidebar", (x, y))
 
     cx = x + SIDEBAR_HUD_W // 2
     y0 = y + 30
@@ -2318,7 +2747,7 @@ def draw_sidebar_hud():
     )
     
     # LINE 1 — POINTS (BIGGER)
-    draw_hud_line(f"POINTS: {points}", cx, y0 + gap+15, HUD_FONT_BIG, (255, 80, 80))
+    draw_hud_line(f"POINTS: {game.points}", cx, y0 + gap+15, HUD_FONT_BIG, (255, 80, 80))
     
 def draw_store_popup():
     global STORE_CARD_RECTS, STORE_TYPE_RECTS
@@ -2334,11 +2763,11 @@ def draw_store_popup():
     popup_y = SCREEN_HEIGHT//2 - popup_h//2
     # preview_y = popup_y + 160   # DEFAULT SAFE VALUE
 
-    overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-    overlay.fill((0,0,0,140))
+    overlay = get_fill_surface((SCREEN_WIDTH, SCREEN_HEIGHT), (0,0,0,140))
     screen.blit(overlay, (0,0))
 
-    screen.blit(store_popup_img, (popup_x, popup_y))
+    draw_ui("store_popup_img", (popup_x, popup_y))
+    mark_dirty((popup_x, popup_y, popup_w, popup_h))
 
 
     draw_banner_title("STORE", popup_x + popup_w//2, popup_y + 15)
@@ -2351,7 +2780,7 @@ def draw_store_popup():
 
     row_h  = 24
 
-    for i, c in enumerate(cards):
+    for i, c in enumerate(game.cards):
         y = list_y + i * row_h
 
         rect = pygame.Rect(list_x, y, popup_w - 90, row_h - 4)
@@ -2374,7 +2803,7 @@ def draw_store_popup():
         screen.blit(txt, (rect.x + 8, rect.y + 4))
     
     # ---- TARGET TYPE SELECTION (AFTER CARD LIST) ----
-    type_y = list_y + len(cards) * row_h + 15
+    type_y = list_y + len(game.cards) * row_h + 15
     type_gap = 75
     start_x = popup_x + popup_w//2 - (len(CARD_TYPES)*type_gap)//2
 
@@ -2414,7 +2843,7 @@ def draw_store_popup():
 
     if len(store_selected_indices) == 2:
         i1, i2 = list(store_selected_indices)
-        c1, c2 = cards[i1], cards[i2]
+        c1, c2 = game.cards[i1], game.cards[i2]
 
         if c1["type"] == c2["type"] and store_target_type:
             new_power = min(c1["power"] + c2["power"], CARD_MAX_POWER)
@@ -2438,7 +2867,7 @@ def draw_store_popup():
         popup_y + 12
     )
 
-    screen.blit(close_btn_img, STORE_CLOSE_BTN_RECT.topleft)
+    draw_ui("close_btn_img", STORE_CLOSE_BTN_RECT.topleft)
 
 
     draw_image_button(
@@ -2454,15 +2883,15 @@ def draw_gate_popup():
     popup_y = SCREEN_HEIGHT // 2 - popup_h // 2
 
     # ---- overlay (world side only) ----
-    overlay = pygame.Surface(
+    overlay = get_fill_surface(
         (SCREEN_WIDTH - SIDEBAR_W, SCREEN_HEIGHT),
-        pygame.SRCALPHA
+        (0, 0, 0, 140)
     )
-    overlay.fill((0, 0, 0, 140))
     screen.blit(overlay, (SIDEBAR_W, 0))
 
     # ---- popup background ----
-    screen.blit(store_popup_img, (popup_x, popup_y))
+    draw_ui("store_popup_img", (popup_x, popup_y))
+    mark_dirty((popup_x, popup_y, popup_w, popup_h))
 
     d = can_interact_gate()
     if d is None:
@@ -2473,7 +2902,7 @@ def draw_gate_popup():
     if give_type is None:
         return   # 🔥 DO NOT DRAW POPUP
 
-    gate_card = get_or_create_gate_card(current, d)
+    gate_card = game.gate_card(game.current, d)
     need_power = gate_card["power"]
     rewards = gate_card["rewards"]
 
@@ -2574,9 +3003,11 @@ def draw_room_debug_info():
         return
 
     lines = [
-        f"START ROOM : {START_ROOM}",
-        f"END ROOM   : {finish_room}",
-        f"CURRENT    : {current}",
+        f"START ROOM : {game.start_room}",
+        f"END ROOM   : {game.finish_room}",
+        f"CURRENT    : {game.current}",
+        f"SEED       : {game.seed}",
+        f"FRAME      : {frame_stats['fps']:.0f} fps / {frame_stats['avg_ms']:.1f} ms",
     ]
 
     x = SIDEBAR_W + 20
@@ -2586,45 +3017,329 @@ def draw_room_debug_info():
     for i, line in enumerate(lines):
         txt = retro_small.render(line, True, (255, 120, 120))
         screen.blit(txt, (x, y + i * gap))
+        mark_dirty((x, y + i * gap, *txt.get_size()))
+
+
+# =========================
+# STATIC LAYERS
+# =========================
+# Background layers that never change during a run are baked once into a
+# single opaque surface. Layers are drawn bottom → top.
+def draw_sidebar_layer(surf):
+    surf.blit(get_asset("sidebar_bg"), (0, 0))
+
+
+def draw_world_layer(surf):
+    surf.blit(get_asset("bg_world"), (SIDEBAR_W, 0))
+    pygame.draw.rect(surf, (30,30,30), GAME_BOX_RECT)
+    pygame.draw.rect(surf, (180,180,180), GAME_BOX_RECT, 2)
+
+
+STATIC_LAYERS = [draw_sidebar_layer, draw_world_layer]
+static_frame = None
+
+
+def invalidate_static_layers():
+    global static_frame
+    static_frame = None
+    room_view_cache.clear()   # room views are composed on top of it
+    request_full_redraw()
+
+
+def get_static_frame():
+    global static_frame
+    if static_frame is None:
+        static_frame = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        for draw_layer in STATIC_LAYERS:
+            draw_layer(static_frame)
+    return static_frame
+
+
+# =========================
+# DIRTY RECTS
+# =========================
+# Every frame is still drawn in full into `screen`; only the parts that
+# changed are pushed to the window. Scene changes (room, popups, input)
+# fall back to a whole-window flip.
+dirty_rects = []          # regions changed this frame
+last_dirty_rects = []     # regions changed last frame (must be restored too)
+full_redraw = True
+last_frame_key = None
+last_cards_key = None
+last_hud_points = None
+
+SIDEBAR_HUD_RECT = pygame.Rect(
+    (SIDEBAR_W - SIDEBAR_HUD_W) // 2, 18,
+    SIDEBAR_HUD_W + 4, SIDEBAR_HUD_H + 4
+)
+
+
+def mark_dirty(rect):
+    if DIRTY_RECTS:
+        dirty_rects.append(pygame.Rect(rect))
+
+
+def request_full_redraw():
+    global full_redraw
+    full_redraw = True
+
+
+def present_frame(frame_key=None, full=False):
+    global full_redraw, last_frame_key, dirty_rects, last_dirty_rects
+
+    if not DIRTY_RECTS or full or full_redraw or frame_key != last_frame_key:
+        pygame.display.flip()
+    else:
+        pygame.display.update(last_dirty_rects + dirty_rects)
+
+    last_dirty_rects = dirty_rects
+    dirty_rects = []
+    full_redraw = full
+    last_frame_key = frame_key
+
+
+def get_cards_area_rect(start_y):
+    rows = (len(game.cards) - 1) // CARDS_PER_ROW + 1
+    bottom = start_y + (rows - 1) * (CARD_HEIGHT - CARDS_ROW_OVERLAP) + CARD_HEIGHT
+    return pygame.Rect(0, start_y - 3, SIDEBAR_W, bottom - start_y + 6)
+
+
+# =========================
+# SCENE ASSETS
+# =========================
+# Only the menu set is waited for before the first frame; the rest
+# streams in the background and is normally done before it is needed.
+SCENE_ASSETS.update({
+    STATE_MENU: ["menu_bg", "logo_img", "btn_1", "btn_3", "cursor_img"],
+    STATE_HOWTO: ["menu_bg", "cursor_img"],
+    STATE_DIFFICULTY: [
+        "menu_bg", "cursor_img",
+        "btn_easy", "btn_medium", "btn_hard",
+        "btn_easy_h", "btn_medium_h", "btn_hard_h",
+    ],
+    STATE_GAME: [
+        "idle_sheet", "walk_sheet",
+        "sidebar_bg", "bg_world", "world_border_img", "minimap_bg",
+        "hud_bg", "hud_bg_sidebar", "msg_bg", "menu_confirm_bg",
+        "store_popup_img", "close_btn_img", "btn_1", "btn_3", "cursor_img",
+        *ROOM_BG.values(),
+        *("card_" + key for key in CARD_IMAGE_KEY.values()),
+    ],
+})
+
+
+# =========================
+# LOADING SCREEN
+# =========================
+LOADING_POLL_MS = 15
+LOADING_BAR_W = 420
+LOADING_BAR_H = 22
+
+
+def draw_loading_screen(done, total):
+    if "menu_bg" in assets:
+        screen.blit(assets["menu_bg"], (0, 0))
+        screen.blit(get_fill_surface((SCREEN_WIDTH, SCREEN_HEIGHT), (0, 0, 0, 160)), (0, 0))
+    else:
+        screen.fill((0, 0, 0))
+
+    title = retro_font.render("LOADING", True, (255, 255, 255))
+    screen.blit(title, (SCREEN_WIDTH // 2 - title.get_width() // 2, SCREEN_HEIGHT // 2 - 60))
+
+    bar = pygame.Rect(0, 0, LOADING_BAR_W, LOADING_BAR_H)
+    bar.center = (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
+    fill = bar.copy()
+    fill.width = int(bar.width * done / max(total, 1))
+
+    pygame.draw.rect(screen, (40, 40, 40), bar)
+    pygame.draw.rect(screen, (255, 215, 0), fill)
+    pygame.draw.rect(screen, (255, 255, 255), bar, 2)
+
+
+def load_scene(scene):
+    """Stream a scene's assets behind a progress bar, then prefetch the rest."""
+    if scene in loaded_scenes:
+        return
+
+    names = SCENE_ASSETS.get(scene, ())
+    stream_assets(names)
+
+    while True:
+        pump_asset_loader()
+        done = sum(1 for name in names if asset_settled(name))
+        if done == len(names):
+            break
+        if not assets_streaming():
+            break   # worker died: preload_scene() loads the rest here
+
+        for e in pygame.event.get():
+            if e.type == pygame.QUIT:
+                pygame.quit()
+                sys.exit()
+            note_window_event(e)
+
+        draw_loading_screen(done, len(names))
+        present_frame(full=True)
+        pygame.time.wait(LOADING_POLL_MS)
+
+    preload_scene(scene)   # aliases + anything that failed on the worker
+    build_ui_atlas(scene)
+    mark_startup(f"assets:{scene}")
+
+    # everything else keeps decoding in the background
+    for other in SCENE_ASSETS.values():
+        stream_assets(other)
+    stream_assets(MUSIC_ASSETS.values())
+
+
+# =========================
+# RENDER ON DEMAND
+# =========================
+# Menu-style scenes only change on input, so they sleep on the event
+# queue instead of redrawing at FPS. A scene is redrawn when it is
+# entered or when any event arrives (hover, scroll, window expose, ...).
+idle_scene = None   # scene drawn by the previous idle frame
+
+
+def wait_for_events(scene):
+    """→ (events, redraw) for an idle scene."""
+    global idle_scene
+
+    if scene != idle_scene:
+        idle_scene = scene
+        return pygame.event.get(), True
+
+    # wake often enough to finish streamed assets while the player idles
+    first = pygame.event.wait(LOADING_POLL_MS if assets_streaming() else IDLE_WAIT_MS)
+    # time spent asleep must not count as a game frame
+    clock.tick()
+
+    events = [] if first.type == pygame.NOEVENT else [first]
+    events.extend(pygame.event.get())
+    for e in events:
+        note_window_event(e)
+    return events, bool(events)
+
+
+# =========================
+# FRAME GOVERNOR
+# =========================
+# Picks the frame cap, decides when optional work (glows, footsteps,
+# minimap) is skipped and keeps frame-time stats. rawtime is the time a
+# frame spent working, without the tick() delay.
+BACKGROUND_FPS = 10   # cap while unfocused / minimized
+FRAME_BUDGET_MS = 1000 / FPS
+SHED_ABOVE = 0.9      # shed once avg work > 90% of the budget ...
+RESTORE_BELOW = 0.6   # ... and restore when it is back under 60%
+
+window_focused = True
+shed_optional = False
+frame_stats = {
+    "avg_ms": 0.0,     # moving average of rawtime
+    "worst_ms": 0,     # worst rawtime in the current window
+    "frames": 0,
+    "elapsed_ms": 0,
+    "fps": float(FPS), # achieved rate over the last full window
+}
+
+
+def note_window_event(e):
+    global window_focused
+
+    if e.type in (pygame.WINDOWFOCUSLOST, pygame.WINDOWMINIMIZED):
+        window_focused = False
+    elif e.type in (pygame.WINDOWFOCUSGAINED, pygame.WINDOWRESTORED):
+        window_focused = True
+
+
+def window_active():
+    return window_focused and pygame.display.get_active()
+
+
+def target_fps():
+    return FPS if window_active() else BACKGROUND_FPS
+
+
+def update_frame_stats():
+    global shed_optional
+
+    raw = clock.get_rawtime()
+    stats = frame_stats
+    stats["avg_ms"] += (raw - stats["avg_ms"]) * 0.1
+    stats["worst_ms"] = max(stats["worst_ms"], raw)
+    stats["frames"] += 1
+    stats["elapsed_ms"] += clock.get_time()
+
+    # hysteresis so a single slow frame does not flicker effects on/off
+    if not shed_optional and stats["avg_ms"] > FRAME_BUDGET_MS * SHED_ABOVE:
+        shed_optional = True
+        request_full_redraw()
+    elif shed_optional and stats["avg_ms"] < FRAME_BUDGET_MS * RESTORE_BELOW:
+        shed_optional = False
+        request_full_redraw()
+
+    if stats["elapsed_ms"] >= 1000:
+        stats["fps"] = stats["frames"] * 1000 / stats["elapsed_ms"]
+        if DEBUG:
+            print(
+                f"[FRAMES] {stats['fps']:.1f} fps | "
+                f"avg {stats['avg_ms']:.1f} ms | worst {stats['worst_ms']} ms"
+                + (" | shedding" if shed_optional else "")
+            )
+        stats["frames"] = 0
+        stats["elapsed_ms"] = 0
+        stats["worst_ms"] = 0
 
 
 # =========================
 # LOOP
 # =========================
 while True:
-    clock.tick(FPS)
+    clock.tick(target_fps())
+    pump_asset_loader()
+    load_scene(game_state)
     
     
     if game_state == STATE_MENU:
         if not pygame.mixer.music.get_busy():
             play_music(MUSIC_MENU)
-        handle_menu_events()
-        draw_main_menu()
-        draw_cursor()
-        pygame.display.flip()
+        events, redraw = wait_for_events(STATE_MENU)
+        handle_menu_events(events)
+        if redraw:
+            draw_main_menu()
+            draw_cursor()
+            present_frame(full=True)
+            if STARTUP_REPORT:
+                finish_startup_report()
+            startup_marks = None   # booted; stop recording
         continue
 
 
     if game_state == STATE_HOWTO:
-        handle_howto_events()
-        draw_howto_screen()
-        draw_cursor()
-        pygame.display.flip()
+        events, redraw = wait_for_events(STATE_HOWTO)
+        handle_howto_events(events)
+        if redraw:
+            draw_howto_screen()
+            draw_cursor()
+            present_frame(full=True)
         continue
 
     if game_state == STATE_DIFFICULTY:
-        handle_difficulty_events()
-        draw_difficulty_screen()
-        draw_cursor()
-        pygame.display.flip()
+        events, redraw = wait_for_events(STATE_DIFFICULTY)
+        handle_difficulty_events(events)
+        if redraw:
+            draw_difficulty_screen()
+            draw_cursor()
+            present_frame(full=True)
         continue
     
     if game_state == STATE_GAME:
         
         
-        if GAME_ENDED:
+        if game.ended:
             # Handle events for game ended screen
-            for e in pygame.event.get():
+            events, redraw = wait_for_events((STATE_GAME, game.ended))
+            for e in events:
                 if e.type == pygame.QUIT:
                     pygame.quit()
                     sys.exit()
@@ -2640,10 +3355,13 @@ while True:
                 if e.type == pygame.MOUSEBUTTONDOWN:
                     game_state = STATE_MENU
                     continue
-            
+
+            if not redraw:
+                continue
+
             screen.fill((0, 0, 0))
 
-            if GAME_OVER:
+            if game.game_over:
                 txt = retro_font.render("GAME OVER", True, (255, 80, 80))
                 screen.blit(
                     txt,
@@ -2653,7 +3371,7 @@ while True:
             else:
                 # Calculate final score
                 score_multiplier = difficulty_settings[current_difficulty]["score_multiplier"]
-                final_score = points * score_multiplier
+                final_score = game.points * score_multiplier
                 
                 # "YOU ESCAPED!" title
                 txt = retro_font.render("YOU ESCAPED!", True, (80, 255, 120))
@@ -2680,7 +3398,7 @@ while True:
                 )
                 
                 # Show calculation breakdown
-                breakdown = retro_small.render(f"({points} points × {score_multiplier})", True, (150, 150, 150))
+                breakdown = retro_small.render(f"({game.points} points × {score_multiplier})", True, (150, 150, 150))
                 screen.blit(
                     breakdown,
                     (SCREEN_WIDTH // 2 - breakdown.get_width() // 2,
@@ -2695,9 +3413,11 @@ while True:
             )
             
             draw_cursor()
-            pygame.display.flip()
+            present_frame(full=True)
             continue   # 🔴 THIS STOPS ALL GAME LOGIC
-        
+
+        idle_scene = None   # next menu / end screen starts with a redraw
+        update_frame_stats()
         
         
         
@@ -2705,17 +3425,8 @@ while True:
             gate_message_timer -= 1
 
         dt = clock.get_time() / 1000  # seconds
-        time_accumulator += dt
-
-        if not GAME_OVER and not GAME_WIN:
-            if time_accumulator >= 1:
-                points -= POINT_DECAY_PER_SEC
-                time_accumulator = 0
-
-                if points <= 0:
-                    points = 0
-                    GAME_OVER = True
-                    GAME_ENDED = True
+        # the clock stops while the game is in the background
+        game.step(("tick", dt if window_active() else 0))
 
 
 
@@ -2748,13 +3459,12 @@ while True:
         elif dx < 0: player_dir = "left"
         elif dx > 0: player_dir = "right"
 
-        anim_timer += 1
-        if anim_timer >= 8:        # animation speed
-            anim_timer = 0
-            player_frame = (player_frame + 1) % 4
+        player_frame, anim_timer = advance_animation(
+            "walk", player_frame, anim_timer
+        )
     else:
         moving = False
-        player_frame = 0
+        player_frame, _ = advance_animation("idle", player_frame, anim_timer)
     
     # =========================
     # FOOTSTEP SOUND (FIXED)
@@ -2762,7 +3472,8 @@ while True:
     if moving:
         footstep_timer += 1
         if footstep_timer >= 15:   # adjust for speed (10–20)
-            SFX_FOOTSTEP.play()
+            if not shed_optional:
+                play_sfx("sfx_footstep")
             footstep_timer = 0
     else:
         footstep_timer = 0
@@ -2788,52 +3499,39 @@ while True:
     prev_show_gate_popup = show_gate_popup
     # screen.fill((0,0,0))
 
-    # Sidebar
-    screen.blit(sidebar_bg, (0, 0))
+    # Sidebar (baked)
+    screen.blit(get_static_frame(), (0, 0), (0, 0, SIDEBAR_W, SCREEN_HEIGHT))
     cards_top = draw_cards_title()
     cards_start_y = cards_top + 12
     handle_events(cards_start_y)
     # Game box border
     
     # ===== WORLD BACKGROUND (MAIN ROOM + PREVIEWS) =====
-    # world_x = SIDEBAR_W
-    world_x = SIDEBAR_W
-    world_y = 0
-    screen.blit(bg_world, (world_x, world_y))
-    # screen.blit(world_border_img, (world_x, world_y))
-
-    pygame.draw.rect(screen, (30,30,30), GAME_BOX_RECT)
-    pygame.draw.rect(screen, (180,180,180), GAME_BOX_RECT, 2)
-
-    room = rooms[current]
-    cx, cy = ROOM_RECT.topleft
-    w = h = ROOM_DRAW
-    half = w // 2
-
-    # Center
-    screen.blit(BG[room["type"]], (cx, cy))
-
-    # Neighbors (VISIBLE, NOT CLIPPED)
-    if "top" in room["links"]:
-        t = rooms[room["links"]["top"]]
-        screen.blit(BG[t["type"]].subsurface((0, half, w, half)), (cx, cy-half))
-    if "bottom" in room["links"]:
-        b = rooms[room["links"]["bottom"]]
-        screen.blit(BG[b["type"]].subsurface((0, 0, w, half)), (cx, cy+w))
-    if "left" in room["links"]:
-        l = rooms[room["links"]["left"]]
-        screen.blit(BG[l["type"]].subsurface((half, 0, half, h)), (cx-half, cy))
-    if "right" in room["links"]:
-        r = rooms[room["links"]["right"]]
-        screen.blit(BG[r["type"]].subsurface((0, 0, half, h)), (cx+w, cy))
+    screen.blit(get_room_view(game.current), (SIDEBAR_W, 0))
 
     # === STEP 5: draw animated player ===
     img = get_player_frame(player_dir, player_frame, moving)
     screen.blit(img, player.topleft)
+    mark_dirty((player.topleft, img.get_size()))
     
-    rows = (len(cards) - 1) // CARDS_PER_ROW + 1
+    rows = (len(game.cards) - 1) // CARDS_PER_ROW + 1
     cards_end_y = cards_start_y + rows * (CARD_HEIGHT - CARDS_ROW_OVERLAP)
 
+    cards_key = (
+        tuple((c["type"], c["power"]) for c in game.cards),
+        tuple(sorted(selected_card_indices)),
+        tuple(sorted(store_selected_indices)),
+        gate_dir
+    )
+    if cards_key != last_cards_key:
+        mark_dirty(get_cards_area_rect(cards_start_y))
+        last_cards_key = cards_key
+
+    # points HUD only changes once a second
+    if game.points != last_hud_points:
+        mark_dirty(SIDEBAR_HUD_RECT)
+        last_hud_points = game.points
+
     trade_button_rect = draw_trade_button_center(cards_end_y)
 
     # cards_top = draw_cards_title()
@@ -2842,7 +3540,8 @@ while True:
     draw_sidebar_hud()
     # LEFT SIDEBAR & CARDS ARE ALWAYS DRAWN
     draw_cards(cards_start_y)
-    draw_minimap()
+    if not shed_optional:
+        draw_minimap()
     # draw_gate_message()
 
     # POPUPS DRAW ON TOP
@@ -2864,17 +3563,17 @@ while True:
 
 
     
-    if GAME_OVER:
+    if game.game_over:
         txt = retro_font.render("GAME OVER", True, (255, 80, 80))
         screen.blit(txt, (SCREEN_WIDTH//2 - txt.get_width()//2,
                           SCREEN_HEIGHT//2 - 20))
-        pygame.display.flip()
+        present_frame(full=True)
         continue
-    if GAME_WIN:
+    if game.game_win:
         txt = retro_font.render("YOU ESCAPED!", True, (80, 255, 120))
         screen.blit(txt, (SCREEN_WIDTH//2 - txt.get_width()//2,
                           SCREEN_HEIGHT//2 - 20))
-        pygame.display.flip()
+        present_frame(full=True)
         continue
 
 
@@ -2882,7 +3581,7 @@ while True:
 
 
 
-    # title_text = f"{room['type']} CHAMBER  -  #{current}"
+    # title_text = f"{room['type']} CHAMBER  -  #{game.current}"
     # title = retro_font.render(title_text, True, (240, 240, 240))
 
     # title_x = GAME_BOX_RECT.centerx - title.get_width() // 2
@@ -2902,13 +3601,21 @@ while True:
     cursor_x = mx
     cursor_y = my
 
-    screen.blit(cursor_img, (cursor_x, cursor_y))
+    cursor = get_asset("cursor_img")
+    draw_ui("cursor_img", (cursor_x, cursor_y))
+    mark_dirty((cursor_x, cursor_y, *cursor.get_size()))
     
     if not show_store_popup and not show_gate_popup and not show_menu_confirmation:
         world_x = SIDEBAR_W
         world_y = 0
-        screen.blit(world_border_img, (world_x, world_y))
+        draw_ui("world_border_img", (world_x, world_y))
 
     draw_room_debug_info()
     draw_gate_message()
-    pygame.display.flip()
+    present_frame((
+        game.current,
+        show_store_popup,
+        show_gate_popup,
+        show_menu_confirmation,
+        DEBUG
+    ))
@@ -0,0 +1,300 @@
+"""Monte-Carlo batch simulator for GateBound.
+
+Plays complete runs headlessly on engine.GameState across a process
+pool and streams aggregate statistics per difficulty (win rate, points
+left, rooms visited, store uses, power of the gates opened).
+
+    python simulate.py                          # 2000 greedy runs per difficulty
+    python simulate.py -n 10000 -p random -d hard
+    python simulate.py --seed 42 --out sim.json
+
+Runs are seeded seed, seed + 1, ... so a batch is reproducible no matter
+how the pool schedules it.
+"""
+import argparse
+import json
+import multiprocessing
+import random
+import sys
+import time
+from collections import deque
+
+from engine import (
+    GameState, CARD_MAX_POWER,
+    DIFFICULTY_EASY, DIFFICULTY_MEDIUM, DIFFICULTY_HARD, difficulty_settings,
+)
+from solver import reset_winnable
+
+DIFFICULTIES = [DIFFICULTY_EASY, DIFFICULTY_MEDIUM, DIFFICULTY_HARD]
+ROOM_SECONDS = 2      # walking to a gate + reading the popup, per action
+MAX_ACTIONS = 5000    # safety net; points run out long before this
+
+
+# =========================
+# POLICIES
+# =========================
+# policy(game, rng) → next action for game.step(), or None if it gives up
+
+def pick_cards(cards, required_type, power):
+    """Fewest, then weakest, same-type cards whose power reaches `power`."""
+    same = sorted(
+        (i for i, c in enumerate(cards) if c["type"] == required_type),
+        key=lambda i: cards[i]["power"],
+        reverse=True
+    )
+    chosen, total = [], 0
+    for i in same:
+        if total >= power:
+            break
+        chosen.append(i)
+        total += cards[i]["power"]
+    if total < power:
+        return None
+
+    # drop the weakest picks again while the requirement still holds
+    for i in sorted(chosen, key=lambda i: cards[i]["power"]):
+        if total - cards[i]["power"] >= power:
+            chosen.remove(i)
+            total -= cards[i]["power"]
+    return chosen
+
+
+def pick_reward(game, gate):
+    """Reward of the type the hand has least of."""
+    counts = {}
+    for c in game.cards:
+        counts[c["type"]] = counts.get(c["type"], 0) + 1
+    rewards = gate["rewards"]
+    return min(range(len(rewards)), key=lambda i: counts.get(rewards[i]["type"], 0))
+
+
+def pick_trade(game, target_type):
+    """Two same-type cards (not target_type) with the most combined power."""
+    best = None
+    for a in range(len(game.cards)):
+        for b in range(a + 1, len(game.cards)):
+            ca, cb = game.cards[a], game.cards[b]
+            if ca["type"] != cb["type"] or ca["type"] == target_type:
+                continue
+            power = min(ca["power"] + cb["power"], CARD_MAX_POWER)
+            if best is None or power > best[0]:
+                best = (power, [a, b])
+    return None if best is None else ("trade", best[1], target_type)
+
+
+def open_gate_action(game, d):
+    gate = game.gate_card(game.current, d)
+    chosen = pick_cards(game.cards, game.next_room_type(d), gate["power"])
+    if chosen is None:
+        return None
+    return ("open_gate", d, chosen, pick_reward(game, gate))
+
+
+def random_policy(game, rng):
+    """Random gate; open it if the hand can, otherwise walk or trade at random."""
+    links = list(game.rooms[game.current]["links"])
+    rng.shuffle(links)
+    for d in links:
+        if game.gate_open(d):
+            return ("walk", d)
+        action = open_gate_action(game, d)
+        if action is not None:
+            return action
+
+    if game.store_uses_left > 0:
+        return pick_trade(game, game.next_room_type(links[0]))
+    return None
+
+
+def frontier(game):
+    """(room, path, direction) for every closed gate reachable through open ones, nearest first."""
+    paths = {game.current: []}
+    todo = deque([game.current])
+    while todo:
+        rid = todo.popleft()
+        room = game.rooms[rid]
+        for d, nxt in room["links"].items():
+            if room["open_gates"][d]:
+                if nxt not in paths:
+                    paths[nxt] = paths[rid] + [d]
+                    todo.append(nxt)
+            else:
+                yield rid, paths[rid], d
+
+
+def greedy_policy(game, rng):
+    """Head for the closed gate whose far side is nearest the finish.
+
+    Walks there through open gates, opens it with the fewest cards that
+    cover the requirement, and trades in the store when no gate in reach
+    can be paid for.
+    """
+    best_open, best_any = None, None
+    for rid, path, d in frontier(game):
+        nxt = game.rooms[rid]["links"][d]
+        score = (game.distance(nxt, game.finish_room), len(path))
+        if best_any is None or score < best_any[0]:
+            best_any = (score, rid, path, d)
+
+        gate = game.gate_card(rid, d)
+        required_type = game.rooms[nxt]["type"]
+        if pick_cards(game.cards, required_type, gate["power"]) is None:
+            continue
+        if best_open is None or score < best_open[0]:
+            best_open = (score, rid, path, d)
+
+    if best_open is not None:
+        _, rid, path, d = best_open
+        if path:
+            return ("walk", path[0])
+        return open_gate_action(game, d)
+
+    if best_any is not None and game.store_uses_left > 0:
+        _, rid, path, d = best_any
+        return pick_trade(game, game.rooms[game.rooms[rid]["links"][d]]["type"])
+    return None
+
+
+POLICIES = {
+    "random": random_policy,
+    "greedy": greedy_policy,
+}
+
+
+# =========================
+# RUNS
+# =========================
+def play(task):
+    """Worker: play one full run → result dict."""
+    difficulty, policy_name, seed, room_seconds = task
+    settings = difficulty_settings[difficulty]
+    policy = POLICIES[policy_name]
+    rng = random.Random(f"{seed}:policy")
+
+    game = GameState(seed=seed)
+    game.configure(settings["max_points"], settings["point_decay"], settings["store_uses"])
+    reset_winnable(game)   # same runs the game would hand out
+
+    gate_powers = []
+    stuck = False
+    for _ in range(MAX_ACTIONS):
+        if game.ended:
+            break
+        action = policy(game, rng)
+        if action is None:
+            stuck = True
+            break
+        if action[0] == "open_gate":
+            power = game.gate_card(game.current, action[1])["power"]
+        if game.step(action) and action[0] == "open_gate":
+            gate_powers.append(power)
+
+        # the engine decays points once per full second it is ticked
+        for _ in range(room_seconds):
+            game.step(("tick", 1))
+
+    return {
+        "difficulty": difficulty,
+        "seed": seed,
+        "win": game.game_win,
+        "stuck": stuck,
+        "points": game.points,
+        "rooms_visited": len(game.visited_rooms),
+        "store_uses": settings["store_uses"] - game.store_uses_left,
+        "gate_powers": gate_powers,
+    }
+
+
+class Stats:
+    """Running aggregates for one difficulty (nothing per-run is kept)."""
+
+    def __init__(self):
+        self.runs = 0
+        self.wins = 0
+        self.stuck = 0
+        self.win_points = 0
+        self.rooms_visited = 0
+        self.store_uses = 0
+        self.gate_power = [0] * (CARD_MAX_POWER + 1)
+
+    def add(self, r):
+        self.runs += 1
+        self.wins += r["win"]
+        self.stuck += r["stuck"]
+        if r["win"]:
+            self.win_points += r["points"]
+        self.rooms_visited += r["rooms_visited"]
+        self.store_uses += r["store_uses"]
+        for p in r["gate_powers"]:
+            self.gate_power[p] += 1
+
+    def summary(self):
+        n = max(self.runs, 1)
+        return {
+            "runs": self.runs,
+            "win_rate": round(self.wins / n, 4),
+            "stuck_rate": round(self.stuck / n, 4),
+            "mean_points_on_win": round(self.win_points / self.wins, 1) if self.wins else None,
+            "mean_rooms_visited": round(self.rooms_visited / n, 2),
+            "mean_store_uses": round(self.store_uses / n, 3),
+            "gate_power": {p: c for p, c in enumerate(self.gate_power) if c},
+        }
+
+
+def print_table(stats):
+    print(f"{'difficulty':<10}  {'runs':>7}  {'win':>6}  {'stuck':>6}  "
+          f"{'pts(win)':>8}  {'rooms':>6}  {'store':>6}")
+    for difficulty, st in stats.items():
+        s = st.summary()
+        pts = "-" if s["mean_points_on_win"] is None else f"{s['mean_points_on_win']:.0f}"
+        print(f"{difficulty:<10}  {s['runs']:>7}  {s['win_rate']:>6.1%}  {s['stuck_rate']:>6.1%}  "
+              f"{pts:>8}  {s['mean_rooms_visited']:>6.1f}  {s['mean_store_uses']:>6.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-n", "--runs", type=int, default=2000, help="runs per difficulty")
+    parser.add_argument("-p", "--policy", choices=sorted(POLICIES), default="greedy")
+    parser.add_argument("-d", "--difficulty", choices=DIFFICULTIES, action="append",
+                        help="repeatable; default: all")
+    parser.add_argument("--seed", type=int, default=0, help="first run seed")
+    parser.add_argument("--room-seconds", type=int, default=ROOM_SECONDS,
+                        help="in-game seconds each action costs")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="worker processes")
+    parser.add_argument("--every", type=int, default=1000, help="progress line every N runs")
+    parser.add_argument("--out", help="write the final summary as JSON")
+    args = parser.parse_args()
+
+    difficulties = args.difficulty or DIFFICULTIES
+    tasks = [
+        (difficulty, args.policy, args.seed + i, args.room_seconds)
+        for difficulty in difficulties
+        for i in range(args.runs)
+    ]
+    stats = {difficulty: Stats() for difficulty in difficulties}
+
+    t0 = time.perf_counter()
+    with multiprocessing.Pool(args.jobs) as pool:
+        for done, r in enumerate(pool.imap_unordered(play, tasks, chunksize=64), 1):
+            stats[r["difficulty"]].add(r)
+            if done % args.every == 0:
+                rate = done / (time.perf_counter() - t0)
+                print(f"{done}/{len(tasks)} runs ({rate:.0f}/s)", file=sys.stderr)
+
+    elapsed = time.perf_counter() - t0
+    print_table(stats)
+    print(f"\n{len(tasks)} runs, policy {args.policy}, {elapsed:.1f}s", file=sys.stderr)
+
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump({
+                "policy": args.policy,
+                "seed": args.seed,
+                "room_seconds": args.room_seconds,
+                "difficulties": {d: st.summary() for d, st in stats.items()},
+            }, f, indent=2)
+        print(f"wrote {args.out}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
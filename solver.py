@@ -0,0 +1,268 @@
+"""Solvability check for a GateBound run.
+
+Answers "can the finish room still be reached from here?" from the
+current hand, store uses and opened gates, ignoring the clock.
+
+Open gates are free to walk through, so the player can always get back
+to any visited room: a search state is (opened gates, hand multiset,
+store uses left), not the room the player stands in. Gates left open by
+earlier runs are walkable too, so the rooms behind them count as
+visited. The run is won by opening a gate into the finish room (walking
+in through an open one does not count). A first pass only opens gates
+that step towards the finish, which settles most winnable runs within a
+few dozen nodes. The full search is a depth-first walk that tries gates
+nearest the finish first, memoizes states it has seen, and prunes a
+state when an earlier one with the same opened gates had at least as
+many uses left and a hand that is at least as strong per type. Closed
+gates between two visited rooms are still moves (their reward converts
+cards), so False really means unwinnable.
+
+The search is capped by a node count, not the clock, so a seed deals
+the same run on every machine.
+
+    solve(game)  → True (winnable), False (provably not), None (out of nodes)
+    reset_winnable(game)  → game.reset() until solve() stops saying False
+                            (worlds over SOLVE_MAX_ROOMS rooms are dealt unchecked)
+
+    python solver.py [seeds]   # check that stale open gates keep deals winnable
+"""
+from itertools import combinations
+
+from engine import CARD_TYPES, CARD_MAX_POWER
+
+SOLVE_NODES = 250     # search nodes per solve() (≤ ~50 ms up to 30x30)
+RESET_TRIES = 4       # reset_winnable keeps the last run after this many
+SOLVE_MAX_ROOMS = 30 * 30   # bigger worlds are dealt unchecked: hardly any run is decided
+
+
+WIN = object()   # children() marker: a gate into the finish can be opened
+
+
+class OutOfNodes(Exception):
+    pass
+
+
+def edge(a, b):
+    return (a, b) if a < b else (b, a)
+
+
+def hand_key(cards):
+    """Hand as a canonical multiset: one sorted (desc) power tuple per card type."""
+    return tuple(
+        tuple(sorted((c["power"] for c in cards if c["type"] == t), reverse=True))
+        for t in CARD_TYPES
+    )
+
+
+def dominates(a, b):
+    """True if hand a can do everything hand b can (per type, card for card)."""
+    for pa, pb in zip(a, b):
+        if len(pa) < len(pb):
+            return False
+        if any(x < y for x, y in zip(pa, pb)):
+            return False
+    return True
+
+
+def remove(powers, used):
+    rest = list(powers)
+    for p in used:
+        rest.remove(p)
+    return tuple(rest)
+
+
+def add(powers, p):
+    return tuple(sorted(powers + (p,), reverse=True))
+
+
+def payments(powers, required):
+    """Minimal multisets of `powers` (desc tuple) that reach `required`, least overpaid first."""
+    found = set()
+    for k in range(1, len(powers) + 1):
+        for combo in combinations(powers, k):
+            if sum(combo) < required or combo in found:
+                continue
+            # minimal: dropping the weakest card must fall short
+            if sum(combo) - combo[-1] >= required:
+                continue
+            found.add(combo)
+    return sorted(found, key=lambda combo: (sum(combo), len(combo)))
+
+
+class Search:
+    def __init__(self, game, budget, direct=False):
+        self.game = game
+        self.budget = budget   # nodes
+        self.direct = direct   # only gates that step closer to the finish
+        self.dist = {}         # room → Manhattan distance to the finish
+        self.nodes = 0
+        self.seen = {}   # opened gates → [(hand, store_uses)]
+
+    def tick(self):
+        self.nodes += 1
+        if self.nodes > self.budget:
+            raise OutOfNodes
+
+    def pruned(self, opened, hand, uses):
+        bucket = self.seen.setdefault(opened, [])
+        for h, u in bucket:
+            if u >= uses and dominates(h, hand):
+                return True
+        # drop entries the new state dominates
+        bucket[:] = [(h, u) for h, u in bucket if not (uses >= u and dominates(hand, h))]
+        bucket.append((hand, uses))
+        return False
+
+    def distance(self, rid):
+        if rid not in self.dist:
+            self.dist[rid] = self.game.distance(rid, self.game.finish_room)
+        return self.dist[rid]
+
+    def flood(self, visited, opened, rooms):
+        """visited plus every room reachable from `rooms` through open gates."""
+        visited = set(visited)
+        todo = list(rooms)
+        while todo:
+            rid = todo.pop()
+            for nxt in self.game.rooms[rid]["links"].values():
+                if nxt not in visited and edge(rid, nxt) in opened:
+                    visited.add(nxt)
+                    todo.append(nxt)
+        return frozenset(visited)
+
+    def frontier(self, visited, opened):
+        """Closed gates of the visited rooms: new rooms nearest-to-finish first."""
+        gates = []
+        for rid in visited:
+            for d, nxt in self.game.rooms[rid]["links"].items():
+                if edge(rid, nxt) in opened:
+                    continue
+                if self.direct and (nxt in visited or self.distance(nxt) >= self.distance(rid)):
+                    continue
+                gates.append((nxt in visited, self.distance(nxt), rid, d, nxt))
+        gates.sort()
+        return gates
+
+    def run(self, visited, opened, hand, uses):
+        """Depth-first over children() on an explicit stack (routes on big worlds run deep)."""
+        stack = []
+        state = (visited, opened, hand, uses)
+        while True:
+            if state is WIN:
+                return True
+            if state is not None:
+                self.tick()
+                if not self.pruned(*state[1:]):
+                    stack.append(self.children(*state))
+            if not stack:
+                return False
+            state = next(stack[-1], None)
+            if state is None:
+                stack.pop()
+
+    def children(self, visited, opened, hand, uses):
+        """States one move away: open a frontier gate, or trade in the store."""
+        for _, _, rid, d, nxt in self.frontier(visited, opened):
+            gate = self.game.gate_card(rid, d)
+            t = CARD_TYPES.index(self.game.rooms[nxt]["type"])
+            options = payments(hand[t], gate["power"])
+            if not options:
+                continue
+            if nxt == self.game.finish_room:
+                yield WIN
+
+            now_opened = opened | {edge(rid, nxt)}
+            now_visited = self.flood(visited | {nxt}, now_opened, [nxt])
+            for paid in options:
+                after = list(hand)
+                after[t] = remove(hand[t], paid)
+                for reward in gate["rewards"]:
+                    r = CARD_TYPES.index(reward["type"])
+                    got = list(after)
+                    got[r] = add(after[r], reward["power"])
+                    yield now_visited, now_opened, tuple(got), uses
+
+        if uses > 0:
+            for t, powers in enumerate(hand):
+                pairs = {(powers[i], powers[j])
+                         for i in range(len(powers)) for j in range(i + 1, len(powers))}
+                for a, b in pairs:
+                    rest = list(hand)
+                    rest[t] = remove(powers, (a, b))
+                    for target in range(len(CARD_TYPES)):
+                        got = list(rest)
+                        got[target] = add(rest[target], min(a + b, CARD_MAX_POWER))
+                        yield visited, opened, tuple(got), uses - 1
+
+
+def solve(game, budget=SOLVE_NODES):
+    """True / False if the finish can (not) be won from game's state; None if out of nodes."""
+    opened = frozenset(
+        edge(rid, room["links"][d])
+        for rid, room in game.rooms.items()
+        for d, is_open in room["open_gates"].items() if is_open
+    )
+    direct = Search(game, budget, direct=True)
+    visited = direct.flood(game.visited_rooms, opened, game.visited_rooms)
+    start = (visited, opened, hand_key(game.cards), game.store_uses_left)
+    try:
+        if direct.run(*start):
+            return True
+        return Search(game, budget - direct.nodes).run(*start)
+    except OutOfNodes:
+        return None
+
+
+def reset_winnable(game, tries=RESET_TRIES, budget=SOLVE_NODES):
+    """Start a new run, re-dealing runs the solver proves unwinnable.
+
+    A run still undecided after `budget` nodes is kept unchecked, and so
+    is the last of `tries` deals; worlds with more than SOLVE_MAX_ROOMS
+    rooms are not checked at all.
+    Returns the number of runs thrown away, or None if the kept run is unproven.
+    """
+    if game.grid_w * game.grid_h > SOLVE_MAX_ROOMS:
+        game.reset()
+        return None
+
+    for rejected in range(tries):
+        game.reset()
+        if game.current == game.finish_room:
+            continue   # the finish only counts when entered through a gate
+        verdict = solve(game, budget)
+        if verdict is not False:
+            return rejected if verdict else None
+    return None
+
+
+# =========================
+# SELF-CHECK
+# =========================
+def check(seeds=50, budget=5000):
+    """Gates left open by an earlier run must not turn a winnable deal
+    unwinnable: open every gate of the start room and solve again → failures."""
+    from engine import GameState, OPPOSITE
+
+    bad = 0
+    for seed in range(seeds):
+        game = GameState(seed=seed)
+        game.reset()
+        before = solve(game, budget)
+
+        room = game.rooms[game.current]
+        for d, nxt in room["links"].items():
+            room["open_gates"][d] = True
+            game.rooms[nxt]["open_gates"][OPPOSITE[d]] = True
+        after = solve(game, budget)
+
+        if before and after is False:
+            bad += 1
+            print(f"seed {seed}: winnable, but unwinnable with the start room's gates open")
+    return bad
+
+
+if __name__ == "__main__":
+    import sys
+    bad = check(int(sys.argv[1]) if len(sys.argv) > 1 else 50)
+    print("open gates handled" if not bad else f"{bad} failures")
+    sys.exit(1 if bad else 0)